@@ -0,0 +1,48 @@
+"""Composite index for status-filtered job listing
+
+Revision ID: 0e7d3a9c5f62
+Revises: 6c2f9e04b8d1
+Create Date: 2025-11-28 16:05:41.902718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e7d3a9c5f62'
+down_revision: Union[str, None] = '6c2f9e04b8d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jobs is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('jobs'):
+        return
+
+    op.create_index(
+        'idx_job_user_status_created_id',
+        'jobs',
+        ['user_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        if_not_exists=True
+    )
+    # Superseded: (user_id, status) is a prefix of the new index
+    op.drop_index('idx_job_user_status', table_name='jobs', if_exists=True)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('jobs'):
+        return
+
+    op.create_index(
+        'idx_job_user_status',
+        'jobs',
+        ['user_id', 'status'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.drop_index('idx_job_user_status_created_id', table_name='jobs', if_exists=True)
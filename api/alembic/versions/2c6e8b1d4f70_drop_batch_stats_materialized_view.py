@@ -0,0 +1,50 @@
+"""Drop the batch stats materialized view
+
+Revision ID: 2c6e8b1d4f70
+Revises: 9a4d2c7e1b53
+Create Date: 2025-11-30 14:06:51.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c6e8b1d4f70'
+down_revision: Union[str, None] = '9a4d2c7e1b53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Batch stats are aggregated live on idx_batch_item_stats, so they match
+    # the batch counters; the view only lagged behind them
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS batch_stats_mv')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # batch_review_items is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('batch_review_items'):
+        return
+
+    op.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS batch_stats_mv AS "
+        "SELECT batch_id, qc_status, review_status, "
+        "count(*) AS item_count, "
+        "sum(qc_score) AS score_sum, "
+        "count(qc_score) AS scored_count "
+        "FROM batch_review_items "
+        "GROUP BY batch_id, qc_status, review_status"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_batch_stats_mv_key "
+        "ON batch_stats_mv (batch_id, qc_status, review_status) NULLS NOT DISTINCT"
+    )
@@ -0,0 +1,34 @@
+"""Partial index for security audit events
+
+Revision ID: 3f9a1c2d7e45
+Revises: c8b4aef41ffc
+Create Date: 2025-11-24 10:12:08.114203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7e45'
+down_revision: Union[str, None] = 'c8b4aef41ffc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_audit_auth_timestamp',
+        'audit_logs',
+        ['timestamp'],
+        unique=False,
+        postgresql_where=sa.text("action LIKE 'auth.%'"),
+        sqlite_where=sa.text("action LIKE 'auth.%'"),
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_auth_timestamp', table_name='audit_logs', if_exists=True)
@@ -0,0 +1,84 @@
+"""QC summary columns on jobs
+
+Revision ID: 4b8e1f6d2a90
+Revises: 0e7d3a9c5f62
+Create Date: 2025-11-28 17:12:53.640118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e1f6d2a90'
+down_revision: Union[str, None] = '0e7d3a9c5f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _job_columns() -> set:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('jobs'):
+        return set()
+    return {column['name'] for column in inspector.get_columns('jobs')}
+
+
+def upgrade() -> None:
+    # jobs is created by init_db() rather than the initial migration, and
+    # create_all adds the summary columns itself on new databases
+    columns = _job_columns()
+    if not columns or 'qc_score' in columns:
+        return
+
+    bind = op.get_bind()
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('qc_score', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('qc_status', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('qc_issues_count', sa.Integer(), nullable=True))
+
+    # Backfill from the stored reports
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', sa.String),
+        sa.column('qc_report', sa.JSON),
+        sa.column('qc_score', sa.Float),
+        sa.column('qc_status', sa.String),
+        sa.column('qc_issues_count', sa.Integer),
+    )
+    rows = bind.execute(
+        sa.select(jobs.c.id, jobs.c.qc_report).where(jobs.c.qc_report.isnot(None))
+    ).all()
+    if rows:
+        bind.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('job_id')),
+            [
+                {
+                    'job_id': row.id,
+                    'qc_score': (row.qc_report or {}).get('score'),
+                    'qc_status': (row.qc_report or {}).get('status'),
+                    'qc_issues_count': len((row.qc_report or {}).get('issues', [])),
+                }
+                for row in rows
+            ]
+        )
+
+    op.create_index(
+        'idx_job_user_qc_score',
+        'jobs',
+        ['user_id', 'qc_score'],
+        unique=False,
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    if 'qc_score' not in _job_columns():
+        return
+
+    op.drop_index('idx_job_user_qc_score', table_name='jobs', if_exists=True)
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('qc_issues_count')
+        batch_op.drop_column('qc_status')
+        batch_op.drop_column('qc_score')
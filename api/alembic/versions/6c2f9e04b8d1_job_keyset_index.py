@@ -0,0 +1,48 @@
+"""Keyset pagination index for jobs
+
+Revision ID: 6c2f9e04b8d1
+Revises: a93e5d1b7c24
+Create Date: 2025-11-28 15:22:09.417352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2f9e04b8d1'
+down_revision: Union[str, None] = 'a93e5d1b7c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jobs is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('jobs'):
+        return
+
+    op.create_index(
+        'idx_job_user_created_id',
+        'jobs',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        if_not_exists=True
+    )
+    # Superseded: (user_id, created_at) is a prefix of the new index
+    op.drop_index('idx_job_user_created', table_name='jobs', if_exists=True)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('jobs'):
+        return
+
+    op.create_index(
+        'idx_job_user_created',
+        'jobs',
+        ['user_id', 'created_at'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.drop_index('idx_job_user_created_id', table_name='jobs', if_exists=True)
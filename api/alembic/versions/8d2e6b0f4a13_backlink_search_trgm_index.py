@@ -0,0 +1,43 @@
+"""Trigram index for backlink search
+
+Revision ID: 8d2e6b0f4a13
+Revises: 3f9a1c2d7e45
+Create Date: 2025-11-25 09:41:52.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e6b0f4a13'
+down_revision: Union[str, None] = '3f9a1c2d7e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm is PostgreSQL-only; other databases keep scanning for search
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # backlinks is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('backlinks'):
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # Expression must match _SEARCH_DOCUMENT in api/app/routes/backlinks.py
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_backlink_search_trgm ON backlinks "
+        "USING gin ((anchor_text || ' ' || publisher_domain || ' ' || "
+        "coalesce(target_url, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_backlink_search_trgm')
@@ -0,0 +1,55 @@
+"""Idempotency key on jobs
+
+Revision ID: 9a4d2c7e1b53
+Revises: 4b8e1f6d2a90
+Create Date: 2025-11-29 09:41:27.305816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d2c7e1b53'
+down_revision: Union[str, None] = '4b8e1f6d2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _job_columns() -> set:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('jobs'):
+        return set()
+    return {column['name'] for column in inspector.get_columns('jobs')}
+
+
+def upgrade() -> None:
+    # jobs is created by init_db() rather than the initial migration, and
+    # create_all adds the column and index itself on new databases
+    columns = _job_columns()
+    if not columns or 'idempotency_key' in columns:
+        return
+
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=255), nullable=True))
+
+    op.create_index(
+        'idx_job_user_idempotency_key',
+        'jobs',
+        ['user_id', 'idempotency_key'],
+        unique=True,
+        postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+        sqlite_where=sa.text("idempotency_key IS NOT NULL"),
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    if 'idempotency_key' not in _job_columns():
+        return
+
+    op.drop_index('idx_job_user_idempotency_key', table_name='jobs', if_exists=True)
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('idempotency_key')
@@ -0,0 +1,41 @@
+"""GIN index for backlink tag filtering
+
+Revision ID: a93e5d1b7c24
+Revises: f2a8d6c41e37
+Create Date: 2025-11-28 09:41:17.305826
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93e5d1b7c24'
+down_revision: Union[str, None] = 'f2a8d6c41e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb containment is PostgreSQL-only; other databases scan tags
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # backlinks is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('backlinks'):
+        return
+
+    # Expression must match _tag_filter in api/app/routes/backlinks.py
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_backlink_tags_gin ON backlinks "
+        "USING gin ((tags::jsonb) jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_backlink_tags_gin')
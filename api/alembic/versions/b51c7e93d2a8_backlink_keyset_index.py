@@ -0,0 +1,48 @@
+"""Keyset pagination index for backlinks
+
+Revision ID: b51c7e93d2a8
+Revises: 8d2e6b0f4a13
+Create Date: 2025-11-25 14:03:27.918640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51c7e93d2a8'
+down_revision: Union[str, None] = '8d2e6b0f4a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # backlinks is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('backlinks'):
+        return
+
+    op.create_index(
+        'idx_backlink_user_created_id',
+        'backlinks',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        if_not_exists=True
+    )
+    # Superseded: (user_id, created_at) is a prefix of the new index
+    op.drop_index('idx_backlink_user_created', table_name='backlinks', if_exists=True)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('backlinks'):
+        return
+
+    op.create_index(
+        'idx_backlink_user_created',
+        'backlinks',
+        ['user_id', 'created_at'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.drop_index('idx_backlink_user_created_id', table_name='backlinks', if_exists=True)
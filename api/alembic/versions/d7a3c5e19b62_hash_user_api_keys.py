@@ -0,0 +1,91 @@
+"""Store SHA-256 of user API keys instead of plaintext
+
+Revision ID: d7a3c5e19b62
+Revises: b51c7e93d2a8
+Create Date: 2025-11-26 09:41:12.305518
+
+"""
+from typing import Sequence, Union
+import hashlib
+import secrets
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c5e19b62'
+down_revision: Union[str, None] = 'b51c7e93d2a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _user_columns() -> set:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('users'):
+        return set()
+    return {column['name'] for column in inspector.get_columns('users')}
+
+
+def upgrade() -> None:
+    # users is created by init_db() rather than the initial migration
+    if 'api_key' not in _user_columns():
+        return
+
+    bind = op.get_bind()
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('api_key_hash', sa.LargeBinary(length=32), nullable=True))
+
+    users = sa.table(
+        'users',
+        sa.column('id', sa.String),
+        sa.column('api_key', sa.String),
+        sa.column('api_key_hash', sa.LargeBinary),
+    )
+    rows = bind.execute(sa.select(users.c.id, users.c.api_key)).all()
+    if rows:
+        bind.execute(
+            users.update().where(users.c.id == sa.bindparam('uid')),
+            [
+                {'uid': row.id, 'api_key_hash': hashlib.sha256(row.api_key.encode('utf-8')).digest()}
+                for row in rows
+            ]
+        )
+
+    # Plaintext keys cannot be recovered after this point
+    op.drop_index('ix_users_api_key', table_name='users', if_exists=True)
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('api_key_hash', existing_type=sa.LargeBinary(length=32), nullable=False)
+        batch_op.drop_column('api_key')
+    op.create_index('ix_users_api_key_hash', 'users', ['api_key_hash'], unique=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if 'api_key_hash' not in _user_columns():
+        return
+
+    bind = op.get_bind()
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('api_key', sa.String(), nullable=True))
+
+    # Hashes are one-way, so every user gets a new key (same format as
+    # app.auth.generate_api_key); the old keys stop working
+    users = sa.table(
+        'users',
+        sa.column('id', sa.String),
+        sa.column('api_key', sa.String),
+    )
+    rows = bind.execute(sa.select(users.c.id)).all()
+    if rows:
+        bind.execute(
+            users.update().where(users.c.id == sa.bindparam('uid')),
+            [
+                {'uid': row.id, 'api_key': f"bacowr_{secrets.token_urlsafe(32)}"}
+                for row in rows
+            ]
+        )
+
+    op.drop_index('ix_users_api_key_hash', table_name='users', if_exists=True)
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('api_key_hash')
+    op.create_index('ix_users_api_key', 'users', ['api_key'], unique=True, if_not_exists=True)
@@ -0,0 +1,50 @@
+"""Materialized view of per-batch review stats
+
+Revision ID: e4c1f7a2b958
+Revises: d7a3c5e19b62
+Create Date: 2025-11-27 10:12:38.661402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c1f7a2b958'
+down_revision: Union[str, None] = 'd7a3c5e19b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Other databases compute batch stats live from batch_review_items
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # batch_review_items is created by init_db() rather than the initial migration
+    if not sa.inspect(op.get_bind()).has_table('batch_review_items'):
+        return
+
+    op.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS batch_stats_mv AS "
+        "SELECT batch_id, qc_status, review_status, "
+        "count(*) AS item_count, "
+        "sum(qc_score) AS score_sum, "
+        "count(qc_score) AS scored_count "
+        "FROM batch_review_items "
+        "GROUP BY batch_id, qc_status, review_status"
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index on the view
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_batch_stats_mv_key "
+        "ON batch_stats_mv (batch_id, qc_status, review_status) NULLS NOT DISTINCT"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS batch_stats_mv')
@@ -0,0 +1,85 @@
+"""Composite indexes for batch listing, item filters and stats
+
+Revision ID: f2a8d6c41e37
+Revises: e4c1f7a2b958
+Create Date: 2025-11-27 15:26:04.118930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8d6c41e37'
+down_revision: Union[str, None] = 'e4c1f7a2b958'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_batch_tables() -> bool:
+    # The batch tables are created by init_db() rather than the initial migration
+    inspector = sa.inspect(op.get_bind())
+    return inspector.has_table('batches') and inspector.has_table('batch_review_items')
+
+
+def upgrade() -> None:
+    if not _has_batch_tables():
+        return
+
+    op.create_index(
+        'idx_batch_user_status_created',
+        'batches',
+        ['user_id', 'status', sa.text('created_at DESC')],
+        unique=False,
+        if_not_exists=True
+    )
+    op.create_index(
+        'idx_batch_user_created',
+        'batches',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+        if_not_exists=True
+    )
+    op.create_index(
+        'idx_batch_review_status_qc',
+        'batch_review_items',
+        ['batch_id', 'review_status', 'qc_score'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.create_index(
+        'idx_batch_item_stats',
+        'batch_review_items',
+        ['batch_id', 'qc_status', 'review_status', 'qc_score'],
+        unique=False,
+        if_not_exists=True
+    )
+    # Superseded: each is a prefix of one of the new indexes
+    op.drop_index('idx_batch_user_status', table_name='batches', if_exists=True)
+    op.drop_index('idx_batch_review_status', table_name='batch_review_items', if_exists=True)
+
+
+def downgrade() -> None:
+    if not _has_batch_tables():
+        return
+
+    op.create_index(
+        'idx_batch_review_status',
+        'batch_review_items',
+        ['batch_id', 'review_status'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.create_index(
+        'idx_batch_user_status',
+        'batches',
+        ['user_id', 'status'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.drop_index('idx_batch_item_stats', table_name='batch_review_items', if_exists=True)
+    op.drop_index('idx_batch_review_status_qc', table_name='batch_review_items', if_exists=True)
+    op.drop_index('idx_batch_user_created', table_name='batches', if_exists=True)
+    op.drop_index('idx_batch_user_status_created', table_name='batches', if_exists=True)
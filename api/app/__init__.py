@@ -0,0 +1,12 @@
+"""
+BACOWR FastAPI backend.
+"""
+
+import sys
+from pathlib import Path
+
+# Repository root, so backend modules can import the engine's `src` package.
+# Set up once for the package instead of in each module that imports src.
+BACOWR_ROOT = Path(__file__).parent.parent.parent
+if str(BACOWR_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACOWR_ROOT))
@@ -2,18 +2,60 @@
 Authentication and authorization utilities.
 """
 
+from datetime import datetime
+from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import APIKeyHeader
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, LargeBinary, bindparam, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
+import asyncio
+import orjson
+import os
 import secrets
+import threading
 import bcrypt as bcrypt_lib
 
+from .core.cache import cache
 from .database import get_db
-from .models.database import User
+from .models.database import User, hash_api_key
 
 # API Key header
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# bcrypt work factor (each +1 doubles hashing time)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Bounds concurrent hashing so a login flood cannot exhaust the threadpool
+_hash_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+# User row cache (keyed by user id)
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+
+# Columns never written to the cache; loaded on access if needed
+_USER_CACHE_EXCLUDED = {"hashed_password", "reset_token", "reset_token_expires"}
+_USER_CACHE_COLUMNS = [
+    column.key for column in inspect(User).columns
+    if column.key not in _USER_CACHE_EXCLUDED
+]
+_USER_DATETIME_COLUMNS = {
+    column.key for column in inspect(User).columns
+    if isinstance(column.type, DateTime)
+}
+_USER_BINARY_COLUMNS = {
+    column.key for column in inspect(User).columns
+    if isinstance(column.type, LargeBinary)
+}
+
+# Hot primary-key lookup, built once so the compiled form is reused
+_USER_BY_ID = select(User).where(User.id == bindparam("uid"))
+
+# API key (SHA-256) -> user id. Hits are re-checked against the cached user
+# row, so a regenerated key stops matching once that row is invalidated.
+# Only used alongside a shared user cache (see get_user_cached).
+_api_key_cache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_api_key_cache_lock = threading.Lock()
+
 
 def generate_api_key() -> str:
     """Generate a secure API key."""
@@ -24,7 +66,7 @@ def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
     # bcrypt has a max password length of 72 bytes
     password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt_lib.gensalt()
+    salt = bcrypt_lib.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt_lib.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -36,6 +78,109 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt_lib.checkpw(password_bytes, hashed_bytes)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread, keeping the event loop free."""
+    async with _hash_semaphore:
+        return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread, keeping the event loop free."""
+    async with _hash_semaphore:
+        return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+def _user_cache_key(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def _serialize_binary(value):
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError
+
+
+def _serialize_user(user: User) -> bytes:
+    return orjson.dumps(
+        {key: getattr(user, key) for key in _USER_CACHE_COLUMNS},
+        default=_serialize_binary
+    )
+
+
+def _deserialize_user(data: bytes) -> User:
+    values = orjson.loads(data)
+    for key in _USER_DATETIME_COLUMNS.intersection(values):
+        if values[key] is not None:
+            values[key] = datetime.fromisoformat(values[key])
+    for key in _USER_BINARY_COLUMNS.intersection(values):
+        if values[key] is not None:
+            values[key] = bytes.fromhex(values[key])
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+def get_user_cached(user_id: str, db: Session) -> Optional[User]:
+    """
+    Load a user by ID, using the short-TTL user cache.
+
+    On a hit the cached row is merged into the session without a SELECT;
+    on a miss it is read from the database and cached. Call
+    invalidate_user_cache() after changing a user.
+
+    The cache is only used when it is shared (Redis): an in-process cache
+    would be invalidated in one worker only, and the others would keep
+    accepting a deactivated user or a demoted role until the TTL ran out.
+    """
+    if not cache.shared:
+        return db.execute(_USER_BY_ID, {"uid": user_id}).scalar_one_or_none()
+
+    key = _user_cache_key(user_id)
+
+    data = cache.get(key)
+    if data is not None:
+        return db.merge(_deserialize_user(data), load=False)
+
+    user = db.execute(_USER_BY_ID, {"uid": user_id}).scalar_one_or_none()
+    if user is not None:
+        _cache_user(user)
+
+    return user
+
+
+def _cache_user(user: User) -> None:
+    cache.set(_user_cache_key(user.id), _serialize_user(user), USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop a user from the cache after a password, role or status change."""
+    cache.delete(_user_cache_key(user_id))
+
+
+def _get_user_by_api_key(api_key: str, db: Session) -> Optional[User]:
+    """Resolve an API key to its user, skipping the DB on a warm cache."""
+    key_hash = hash_api_key(api_key)
+
+    if not cache.shared:
+        return db.query(User).filter(User.api_key_hash == key_hash).first()
+
+    with _api_key_cache_lock:
+        user_id = _api_key_cache.get(key_hash)
+    if user_id is not None:
+        user = get_user_cached(user_id, db)
+        if user is not None and secrets.compare_digest(user.api_key_hash, key_hash):
+            return user
+
+    user = db.query(User).filter(User.api_key_hash == key_hash).first()
+    if user is not None:
+        _cache_user(user)
+        with _api_key_cache_lock:
+            _api_key_cache[key_hash] = user.id
+
+    return user
+
+
 async def get_current_user(
     api_key: str = Security(api_key_header),
     db: Session = Depends(get_db)
@@ -55,7 +200,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    user = db.query(User).filter(User.api_key == api_key).first()
+    user = _get_user_by_api_key(api_key, db)
 
     if not user:
         raise HTTPException(
@@ -4,18 +4,35 @@ Wrapper for BACOWR production API.
 This module integrates the existing BACOWR system with the FastAPI backend.
 """
 
-import sys
-from pathlib import Path
 from typing import Dict, Any, Optional
 import asyncio
 from datetime import datetime
 
-# Add BACOWR root to path
-BACOWR_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(BACOWR_ROOT))
-
+# BACOWR root is put on sys.path by the api.app package
+from .. import BACOWR_ROOT
 from src.production_api import run_production_job
 
+# Cost estimates per job (from cost_calculator.py)
+COST_ESTIMATES = {
+    "anthropic": {
+        "multi_stage": 0.06,
+        "single_shot": 0.02
+    },
+    "openai": {
+        "multi_stage": 0.09,
+        "single_shot": 0.03
+    },
+    "google": {
+        "multi_stage": 0.03,
+        "single_shot": 0.01
+    }
+}
+
+TIME_ESTIMATES = {
+    "multi_stage": 30,  # seconds
+    "single_shot": 15    # seconds
+}
+
 
 class BACOWRWrapper:
     """Wrapper for BACOWR production system."""
@@ -127,27 +144,6 @@ class BACOWRWrapper:
                 "estimated_time_seconds": float
             }
         """
-        # Cost estimates (from cost_calculator.py)
-        COST_ESTIMATES = {
-            "anthropic": {
-                "multi_stage": 0.06,
-                "single_shot": 0.02
-            },
-            "openai": {
-                "multi_stage": 0.09,
-                "single_shot": 0.03
-            },
-            "google": {
-                "multi_stage": 0.03,
-                "single_shot": 0.01
-            }
-        }
-
-        TIME_ESTIMATES = {
-            "multi_stage": 30,  # seconds
-            "single_shot": 15    # seconds
-        }
-
         provider = llm_provider if llm_provider != "auto" else "anthropic"
         cost_per_job = COST_ESTIMATES.get(provider, {}).get(writing_strategy, 0.05)
         time_per_job = TIME_ESTIMATES.get(writing_strategy, 20)
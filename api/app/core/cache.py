@@ -0,0 +1,113 @@
+"""
+Short-lived key/value cache for hot lookups.
+
+Uses Redis when REDIS_URL is configured and falls back to an in-process
+TTL cache otherwise. Redis errors are treated as cache misses, so callers
+always fall through to the database when the cache is unavailable.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from cachetools import TLRUCache
+
+logger = logging.getLogger(__name__)
+
+# How long to stop talking to Redis after a connection error
+REDIS_RETRY_SECONDS = 5.0
+
+
+class Cache:
+    """Byte-value cache with per-key TTL."""
+
+    def __init__(self, redis_url: Optional[str] = None, maxsize: int = 10_000):
+        """
+        Initialize cache.
+
+        Args:
+            redis_url: Redis connection URL (in-process cache if None)
+            maxsize: Max entries held by the in-process cache
+        """
+        self._local = TLRUCache(maxsize=maxsize, ttu=lambda _k, v, now: now + v[0])
+        self._lock = threading.Lock()
+        self._redis = None
+        self._redis_down_until = 0.0
+
+        if redis_url:
+            try:
+                import redis
+
+                self._redis = redis.Redis.from_url(
+                    redis_url,
+                    socket_timeout=0.1,
+                    socket_connect_timeout=0.1
+                )
+            except ImportError:
+                logger.warning("redis package not installed, using in-process cache")
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    @property
+    def shared(self) -> bool:
+        """Whether entries are seen by every process (Redis is configured and up)."""
+        return self._redis_available()
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.warning(f"Redis cache unavailable, falling back to database: {exc}")
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached value or None on miss."""
+        if self._redis_available():
+            try:
+                return self._redis.get(key)
+            except Exception as e:
+                self._redis_failed(e)
+                return None
+
+        with self._lock:
+            entry = self._local.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store value for ttl seconds."""
+        if self._redis_available():
+            try:
+                self._redis.setex(key, ttl, value)
+            except Exception as e:
+                self._redis_failed(e)
+            return
+
+        with self._lock:
+            self._local[key] = (ttl, value)
+
+    def delete(self, *keys: str) -> None:
+        """Drop keys from the cache."""
+        if self._redis is not None:
+            try:
+                self._redis.delete(*keys)
+            except Exception as e:
+                self._redis_failed(e)
+
+        # Always clear local entries too, in case Redis was down when they were set
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+
+# Global instance
+cache = Cache(os.getenv("REDIS_URL"))
+
+
+def job_counts_key(user_id: str) -> str:
+    """Key of a user's per-status job counts (see routes.jobs.list_jobs)."""
+    return f"job:{user_id}:counts"
+
+
+def invalidate_job_counts(user_id: str) -> None:
+    """Drop a user's cached job counts (after a job insert, delete or status change)."""
+    cache.delete(job_counts_key(user_id))
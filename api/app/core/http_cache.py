@@ -0,0 +1,68 @@
+"""
+HTTP validators for conditional GET.
+
+Read endpoints attach a weak ETag (and Last-Modified where there is a
+natural timestamp) and answer a matching If-None-Match with an empty 304,
+skipping the query and serialization of the full response.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts) -> str:
+    """Build a weak ETag from the values that determine a response."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.md5(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against etag (RFC 7232 §3.2)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    """
+    Validator headers for a per-user response.
+
+    Responses are private (they depend on the caller's credentials) and
+    must be revalidated before reuse.
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+    }
+
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            # SQLite returns naive timestamps; they are stored as UTC
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+
+    return headers
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """Empty 304 response carrying the current validators."""
+    return Response(
+        status_code=304,
+        headers=cache_headers(etag, last_modified)
+    )
@@ -0,0 +1,103 @@
+"""
+Job progress events.
+
+Status transitions and progress messages from run_job_background are
+published on a per-job Redis channel, so WebSocket clients connected to any
+API process get them as they happen, including for jobs run by the separate
+worker (python -m app.worker). Without Redis, events are delivered to
+subscribers in the same process only.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def _channel(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+class JobEvents:
+    """Publish/subscribe for per-job progress events."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """
+        Initialize event channel.
+
+        Args:
+            redis_url: Redis connection URL (in-process delivery if None)
+        """
+        self._redis = None
+        self._local: Dict[str, Set[asyncio.Queue]] = {}
+
+        if redis_url:
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.Redis.from_url(
+                    redis_url,
+                    socket_connect_timeout=1.0
+                )
+            except ImportError:
+                logger.warning("redis package not installed, job events are in-process only")
+
+    async def publish(self, job_id: str, event: Dict[str, Any]) -> None:
+        """Send an event to everyone watching the job (best effort)."""
+        if self._redis is not None:
+            try:
+                await self._redis.publish(_channel(job_id), orjson.dumps(event))
+            except Exception as e:
+                logger.warning(f"Could not publish event for job {job_id}: {e}")
+            return
+
+        for queue in self._local.get(job_id, ()):
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[AsyncIterator[Dict[str, Any]]]:
+        """
+        Watch a job's events.
+
+        The subscription is active once the context is entered, so state read
+        afterwards cannot miss a transition published in between.
+        """
+        if self._redis is not None:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(_channel(job_id))
+
+            async def redis_events():
+                async for message in pubsub.listen():
+                    yield orjson.loads(message["data"])
+
+            try:
+                yield redis_events()
+            finally:
+                await pubsub.unsubscribe(_channel(job_id))
+                await pubsub.aclose()
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        self._local.setdefault(job_id, set()).add(queue)
+
+        async def local_events():
+            while True:
+                yield await queue.get()
+
+        try:
+            yield local_events()
+        finally:
+            subscribers = self._local.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._local[job_id]
+
+
+# Global instance
+job_events = JobEvents(os.getenv("REDIS_URL"))
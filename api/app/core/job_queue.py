@@ -0,0 +1,107 @@
+"""
+Queue for content generation jobs.
+
+With REDIS_URL configured, new jobs are pushed onto a Redis list and run by
+a separate worker process (python -m app.worker), so LLM pipelines never
+run inside the API workers. Without Redis, or when Redis cannot be reached,
+callers run the job as an in-process background task instead.
+
+A worker moves each job it takes onto its own processing list and removes
+it once the job has run, so jobs in flight when a worker dies are handed
+out again when that worker restarts.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_KEY = "bacowr:jobs"
+
+
+def _processing_key(worker_id: str) -> str:
+    return f"{JOB_QUEUE_KEY}:processing:{worker_id}"
+
+
+class JobQueue:
+    """Redis list of job descriptors (job_id plus the JobCreate payload)."""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """
+        Initialize queue.
+
+        Args:
+            redis_url: Redis connection URL (queue disabled if None)
+        """
+        self._redis = None
+
+        if redis_url:
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.Redis.from_url(
+                    redis_url,
+                    socket_connect_timeout=1.0
+                )
+            except ImportError:
+                logger.warning("redis package not installed, running jobs in-process")
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    async def enqueue(self, job_id: str, job_create: Dict[str, Any]) -> bool:
+        """
+        Push a job for the worker.
+
+        Returns:
+            False if there is no queue or Redis is unreachable, in which case
+            the caller runs the job itself
+        """
+        if self._redis is None:
+            return False
+
+        try:
+            await self._redis.lpush(
+                JOB_QUEUE_KEY,
+                orjson.dumps({"job_id": job_id, "job_create": job_create})
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Job queue unavailable, running job {job_id} in-process: {e}")
+            return False
+
+    async def dequeue(self, worker_id: str) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Wait for the oldest queued job and take it for this worker.
+
+        Returns:
+            The job descriptor and its raw payload, to pass to ack()
+        """
+        payload = await self._redis.blmove(
+            JOB_QUEUE_KEY, _processing_key(worker_id), 0, "RIGHT", "LEFT"
+        )
+        return orjson.loads(payload), payload
+
+    async def ack(self, worker_id: str, payload: bytes) -> None:
+        """Drop a job the worker has finished from its processing list."""
+        await self._redis.lrem(_processing_key(worker_id), 1, payload)
+
+    async def unfinished(self, worker_id: str) -> List[Dict[str, Any]]:
+        """Jobs a previous run of this worker took but never finished."""
+        payloads = await self._redis.lrange(_processing_key(worker_id), 0, -1)
+        return [orjson.loads(payload) for payload in payloads]
+
+    async def requeue_unfinished(self, worker_id: str) -> None:
+        """Put this worker's unfinished jobs back at the head of the queue."""
+        while await self._redis.lmove(
+            _processing_key(worker_id), JOB_QUEUE_KEY, "RIGHT", "RIGHT"
+        ) is not None:
+            pass
+
+
+# Global instance
+job_queue = JobQueue(os.getenv("REDIS_URL"))
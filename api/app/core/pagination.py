@@ -0,0 +1,45 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor encodes the (created_at, id) of the last row on a page. The next
+page is everything strictly before it in (created_at DESC, id DESC) order,
+which an index on (..., created_at DESC, id DESC) serves without the O(N)
+scan-and-discard of a deep OFFSET.
+"""
+
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import func, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Encode a row position as an opaque URL-safe cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except (UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_before(dialect_name: str, created_column, id_column, created_at: datetime, row_id: str):
+    """Filter for rows after the cursor in (created_at DESC, id DESC) order."""
+    if dialect_name == "sqlite":
+        # SQLite keeps timestamps as text with mixed precision; compare as numbers
+        created_column = func.julianday(created_column)
+        created_at = func.julianday(created_at)
+
+    return tuple_(created_column, id_column) < tuple_(created_at, row_id)
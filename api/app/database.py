@@ -2,10 +2,13 @@
 Database configuration and session management.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import any_, bindparam, create_engine, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+import json
 import os
 from dotenv import load_dotenv
 
@@ -21,18 +24,14 @@ DATABASE_URL = os.getenv(
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-# Create engine
-connect_args = {}
+# Create engine (once per process; sessions share its pool and statement cache)
 if DATABASE_URL.startswith("sqlite"):
     # SQLite specific settings
-    connect_args = {
-        "check_same_thread": False,
-        "connect_args": {"check_same_thread": False}
-    }
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool
+        poolclass=StaticPool,
+        query_cache_size=1200
     )
 else:
     # PostgreSQL settings
@@ -40,10 +39,40 @@ else:
         DATABASE_URL,
         pool_pre_ping=True,
         pool_size=10,
-        max_overflow=20
+        max_overflow=20,
+        query_cache_size=1200
     )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: committed objects keep their loaded state instead
+# of re-SELECTing on the next attribute access
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine
+)
+
+# Async engine for read-heavy handlers (asyncpg / aiosqlite drivers)
+_async_url = make_url(DATABASE_URL)
+if _async_url.get_backend_name() == "sqlite":
+    # A shared connection is only needed to keep an in-memory database alive.
+    # For a file, every AsyncSession gets its own connection: on a shared one
+    # a concurrent request's ROLLBACK would discard a job's uncommitted writes.
+    async_engine = create_async_engine(
+        _async_url.set(drivername="sqlite+aiosqlite"),
+        poolclass=StaticPool if _async_url.database in (None, "", ":memory:") else NullPool,
+        query_cache_size=1200
+    )
+else:
+    async_engine = create_async_engine(
+        _async_url.set(drivername="postgresql+asyncpg"),
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        query_cache_size=1200
+    )
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -64,6 +93,52 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency for async routes to get an AsyncSession.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.execute(select(Item))).scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def dialect_insert(db, model):
+    """
+    Build an INSERT for the session's dialect.
+
+    Unlike the generic insert(), the PostgreSQL and SQLite constructs support
+    on_conflict_do_nothing() / on_conflict_do_update().
+    """
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
+
+def in_values(db, column, values):
+    """
+    Build `column IN values` with the values bound as a single parameter.
+
+    A plain in_() expands to one placeholder per value, so every list length
+    is a different statement to prepare and plan. PostgreSQL compares
+    against one ARRAY parameter (= ANY) and SQLite reads one JSON parameter
+    through json_each.
+    """
+    values = list(values)
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import ARRAY
+
+        return column == any_(bindparam(None, values, type_=ARRAY(column.type)))
+
+    json_values = func.json_each(json.dumps(values)).table_valued("value")
+    return column.in_(select(json_values.c.value))
+
+
 def init_db():
     """Initialize database tables."""
     # Import models to ensure they're registered with Base
@@ -6,12 +6,12 @@ Production-ready REST API for BACOWR content generation system.
 
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 import os
 from dotenv import load_dotenv
 
-from .database import engine, get_db, init_db, Base
+from .database import engine, async_engine, get_db, init_db, Base
 from .auth import create_default_user
 from .routes import jobs, backlinks, analytics, websocket, users, batches, audit, export, auth, user_management
 from .middleware.prometheus import setup_metrics
@@ -27,7 +27,9 @@ app = FastAPI(
     description="BacklinkContent Engine - AI-powered content generation for SEO",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # Serialize validated response models with orjson instead of json.dumps
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -62,6 +64,8 @@ async def startup_event():
 
     # Initialize database
     init_db()
+    app.state.engine = engine
+    app.state.async_engine = async_engine
     print("✓ Database initialized")
 
     # Create default user
@@ -79,6 +83,13 @@ async def startup_event():
     print("=" * 70)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled database connections."""
+    await async_engine.dispose()
+    engine.dispose()
+
+
 # Health check
 @app.get("/health")
 def health_check():
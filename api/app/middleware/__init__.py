@@ -9,7 +9,7 @@ Contains middleware components for:
 - Error handling
 """
 
-from .prometheus import setup_metrics, track_llm_generation, track_job_completion, set_active_jobs, set_batch_progress, track_qc_score
+from .prometheus import setup_metrics, track_llm_generation, track_job_completion, set_active_jobs, set_batch_progress, track_qc_score, track_cache_lookup
 
 __all__ = [
     'setup_metrics',
@@ -18,4 +18,5 @@ __all__ = [
     'set_active_jobs',
     'set_batch_progress',
     'track_qc_score',
+    'track_cache_lookup',
 ]
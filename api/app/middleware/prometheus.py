@@ -65,6 +65,13 @@ batch_review_progress_percent = Gauge(
     ['batch_id']
 )
 
+# Response cache Metrics
+response_cache_lookups_total = Counter(
+    'response_cache_lookups_total',
+    'Response cache lookups',
+    ['endpoint', 'result']  # hit, miss
+)
+
 # QC Metrics
 qc_score_histogram = Histogram(
     'qc_score',
@@ -201,6 +208,20 @@ def track_qc_score(score: float):
     qc_score_histogram.observe(score)
 
 
+def track_cache_lookup(endpoint: str, hit: bool):
+    """
+    Track a response cache lookup.
+
+    Args:
+        endpoint: Cached endpoint name
+        hit: Whether the response was served from cache
+    """
+    response_cache_lookups_total.labels(
+        endpoint=endpoint,
+        result="hit" if hit else "miss"
+    ).inc()
+
+
 # Export tracking functions for use in other modules
 __all__ = [
     'setup_metrics',
@@ -209,4 +230,5 @@ __all__ = [
     'set_active_jobs',
     'set_batch_progress',
     'track_qc_score',
+    'track_cache_lookup',
 ]
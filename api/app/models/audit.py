@@ -4,7 +4,7 @@ Audit logging models.
 Tracks all user actions for security, compliance, and debugging.
 """
 
-from sqlalchemy import Column, String, DateTime, JSON, Text, Index
+from sqlalchemy import Column, String, DateTime, JSON, Text, Index, text
 from sqlalchemy.sql import func
 from .database import Base, generate_uuid
 
@@ -56,6 +56,12 @@ class AuditLog(Base):
         Index('idx_audit_action_timestamp', 'action', 'timestamp'),
         Index('idx_audit_resource', 'resource_type', 'resource_id'),
         Index('idx_audit_ip_timestamp', 'ip_address', 'timestamp'),
+        # Partial index for security events (auth.*)
+        Index(
+            'idx_audit_auth_timestamp', 'timestamp',
+            postgresql_where=text("action LIKE 'auth.%'"),
+            sqlite_where=text("action LIKE 'auth.%'")
+        ),
     )
 
     def __repr__(self):
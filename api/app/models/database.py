@@ -2,10 +2,13 @@
 SQLAlchemy database models.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON, ForeignKey, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON, ForeignKey, Index, LargeBinary, DDL, cast, event, literal_column, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from datetime import datetime
+from typing import Optional
+import hashlib
 import uuid
 
 from ..database import Base
@@ -16,6 +19,27 @@ def generate_uuid():
     return str(uuid.uuid4())
 
 
+def hash_api_key(api_key: str) -> bytes:
+    """SHA-256 digest of an API key, as stored in users.api_key_hash."""
+    return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+
+def qc_summary(qc_report: Optional[dict]) -> dict:
+    """
+    QC columns derived from a qc_report.
+
+    Stored on Job when the report is written (automatically for ORM writes,
+    explicitly for Core updates), so reads and batch snapshots use the
+    columns instead of re-parsing the report JSON.
+    """
+    qc_report = qc_report or {}
+    return {
+        "qc_score": qc_report.get("score"),
+        "qc_status": qc_report.get("status"),
+        "qc_issues_count": len(qc_report.get("issues", [])),
+    }
+
+
 class User(Base):
     """User model for authentication and authorization."""
 
@@ -24,7 +48,9 @@ class User(Base):
     id = Column(String, primary_key=True, default=generate_uuid)
     email = Column(String, unique=True, index=True, nullable=False)
     username = Column(String, unique=True, index=True, nullable=True)  # Wave 5: Optional username
-    api_key = Column(String, unique=True, index=True, nullable=False)
+    # Only the SHA-256 of the API key is stored; keys are high-entropy random
+    # tokens, so a plain hash is enough and lookups stay a single index probe
+    api_key_hash = Column(LargeBinary(32), unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=True)  # Optional for now
 
     # Wave 5: Enhanced user fields
@@ -57,6 +83,22 @@ class User(Base):
     backlinks = relationship("Backlink", back_populates="user", cascade="all, delete-orphan")
     batches = relationship("Batch", back_populates="user", cascade="all, delete-orphan")
 
+    @property
+    def api_key(self) -> Optional[str]:
+        """
+        Plaintext API key.
+
+        Only available on the instance that generated it (to show it once in
+        the create/regenerate response); users loaded from the database only
+        carry api_key_hash.
+        """
+        return self.__dict__.get("_api_key")
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self.__dict__["_api_key"] = value
+        self.api_key_hash = hash_api_key(value)
+
     # Indexes for Wave 5
     __table_args__ = (
         Index('idx_user_role_status', 'role', 'account_status'),
@@ -95,6 +137,11 @@ class Job(Base):
     execution_log = Column(JSON, nullable=True)
     metrics = Column(JSON, nullable=True)
 
+    # QC summary, written with qc_report (see qc_summary)
+    qc_score = Column(Float, nullable=True)
+    qc_status = Column(String, nullable=True)
+    qc_issues_count = Column(Integer, default=0)
+
     # Cost tracking
     estimated_cost = Column(Float, nullable=True)
     actual_cost = Column(Float, nullable=True)
@@ -108,14 +155,32 @@ class Job(Base):
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0)
 
+    # Client-supplied Idempotency-Key of the create request
+    idempotency_key = Column(String(255), nullable=True)
+
     # Relationships
     user = relationship("User", back_populates="jobs")
 
+    @validates("qc_report")
+    def _summarize_qc_report(self, key, qc_report):
+        """Keep the QC summary columns in step with ORM writes of qc_report."""
+        for column, value in qc_summary(qc_report).items():
+            setattr(self, column, value)
+        return qc_report
+
     # Indexes for common queries
     __table_args__ = (
-        Index('idx_job_user_status', 'user_id', 'status'),
-        Index('idx_job_user_created', 'user_id', 'created_at'),
+        Index('idx_job_user_status_created_id', 'user_id', 'status', created_at.desc(), id.desc()),
+        Index('idx_job_user_created_id', 'user_id', created_at.desc(), id.desc()),
         Index('idx_job_status_created', 'status', 'created_at'),
+        Index('idx_job_user_qc_score', 'user_id', 'qc_score'),
+        # One job per (user, idempotency key)
+        Index(
+            'idx_job_user_idempotency_key', 'user_id', 'idempotency_key',
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+            sqlite_where=text("idempotency_key IS NOT NULL")
+        ),
     )
 
 
@@ -159,10 +224,40 @@ class Backlink(Base):
     __table_args__ = (
         Index('idx_backlink_publisher_domain', 'publisher_domain'),
         Index('idx_backlink_category', 'category'),
-        Index('idx_backlink_user_created', 'user_id', 'created_at'),
+        Index('idx_backlink_user_created_id', 'user_id', created_at.desc(), id.desc()),
+        # Serves ?search= ILIKE on PostgreSQL; the expression must match
+        # _SEARCH_DOCUMENT in routes/backlinks.py
+        Index(
+            'ix_backlink_search_trgm',
+            (
+                anchor_text
+                + literal_column("' '")
+                + publisher_domain
+                + literal_column("' '")
+                + func.coalesce(target_url, literal_column("''"))
+            ).label('search_document'),
+            postgresql_using='gin',
+            postgresql_ops={'search_document': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+        # Serves tag containment filters on PostgreSQL; the expression must
+        # match _tag_filter in routes/backlinks.py
+        Index(
+            'ix_backlink_tags_gin',
+            cast(tags, JSONB).label('tags_jsonb'),
+            postgresql_using='gin',
+            postgresql_ops={'tags_jsonb': 'jsonb_path_ops'}
+        ).ddl_if(dialect='postgresql'),
     )
 
 
+# gin_trgm_ops must exist before create_all builds ix_backlink_search_trgm
+event.listen(
+    Backlink.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
 class Batch(Base):
     """
     Batch of jobs for Day 2 QA review workflow.
@@ -210,7 +305,9 @@ class Batch(Base):
 
     # Indexes
     __table_args__ = (
-        Index('idx_batch_user_status', 'user_id', 'status'),
+        # Serve list_batches filtered by status, and unfiltered, already sorted
+        Index('idx_batch_user_status_created', 'user_id', 'status', created_at.desc()),
+        Index('idx_batch_user_created', 'user_id', created_at.desc()),
         Index('idx_batch_status_created', 'status', 'created_at'),
     )
 
@@ -256,8 +353,11 @@ class BatchReviewItem(Base):
 
     # Indexes
     __table_args__ = (
-        Index('idx_batch_review_status', 'batch_id', 'review_status'),
+        # Item listing filters on review status and range-filters/sorts on score
+        Index('idx_batch_review_status_qc', 'batch_id', 'review_status', 'qc_score'),
         Index('idx_batch_qc_score', 'batch_id', 'qc_score'),
+        # Covers the live stats GROUP BY (index-only on PostgreSQL)
+        Index('idx_batch_item_stats', 'batch_id', 'qc_status', 'review_status', 'qc_score'),
     )
 
 
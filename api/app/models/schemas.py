@@ -4,7 +4,7 @@ Pydantic schemas for API request/response validation.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -85,8 +85,8 @@ class JobCreate(BaseModel):
             raise ValueError('Target URL must include protocol (http:// or https://)')
         return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "publisher_domain": "aftonbladet.se",
                 "target_url": "https://sv.wikipedia.org/wiki/Artificiell_intelligens",
@@ -98,6 +98,7 @@ class JobCreate(BaseModel):
                 "enable_llm_profiling": True
             }
         }
+    )
 
 
 class JobUpdate(BaseModel):
@@ -123,13 +124,15 @@ class JobResponse(BaseModel):
     status: str
     estimated_cost: Optional[float]
     actual_cost: Optional[float]
+    qc_score: Optional[float] = None
+    qc_status: Optional[str] = None
+    qc_issues_count: Optional[int] = None
     created_at: datetime
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
     error_message: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class JobDetailResponse(JobResponse):
@@ -141,8 +144,7 @@ class JobDetailResponse(JobResponse):
     metrics: Optional[Dict[str, Any]]
     retry_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Backlink Schemas
@@ -188,8 +190,7 @@ class BacklinkResponse(BaseModel):
     created_at: datetime
     published_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BacklinkStats(BaseModel):
@@ -269,16 +270,25 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(cls, items: List[Any], total: int, page: int, page_size: int):
+    def create(
+        cls,
+        items: List[Any],
+        total: int,
+        page: int,
+        page_size: int,
+        next_cursor: Optional[str] = None
+    ):
         """Create a paginated response."""
         return cls(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=(total + page_size - 1) // page_size
+            total_pages=(total + page_size - 1) // page_size,
+            next_cursor=next_cursor
         )
 
 
@@ -291,8 +301,8 @@ class BatchCreate(BaseModel):
     job_ids: List[str] = Field(..., min_length=1, max_length=1000)
     batch_config: Optional[Dict[str, Any]] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Daily batch 2025-11-19",
                 "description": "175 backlinks for review",
@@ -303,6 +313,7 @@ class BatchCreate(BaseModel):
                 }
             }
         }
+    )
 
 
 class BatchResponse(BaseModel):
@@ -325,8 +336,7 @@ class BatchResponse(BaseModel):
     review_started_at: Optional[datetime]
     review_completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BatchItemResponse(BaseModel):
@@ -348,8 +358,7 @@ class BatchItemResponse(BaseModel):
     # Include job details for convenience
     job: Optional[JobDetailResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BatchDetailResponse(BatchResponse):
@@ -357,8 +366,7 @@ class BatchDetailResponse(BatchResponse):
     items: List[BatchItemResponse]
     batch_config: Optional[Dict[str, Any]]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReviewDecisionRequest(BaseModel):
@@ -366,13 +374,24 @@ class ReviewDecisionRequest(BaseModel):
     decision: ReviewStatus
     reviewer_notes: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "decision": "approved",
                 "reviewer_notes": "Excellent quality, approved for publication"
             }
         }
+    )
+
+
+class BulkReviewItem(ReviewDecisionRequest):
+    """Schema for one decision in a bulk review."""
+    item_id: str
+
+
+class BulkReviewRequest(BaseModel):
+    """Schema for reviewing many batch items in one request."""
+    items: List[BulkReviewItem] = Field(..., min_length=1, max_length=1000)
 
 
 class BatchExportResponse(BaseModel):
@@ -384,8 +403,8 @@ class BatchExportResponse(BaseModel):
     file_path: str
     created_at: datetime
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "batch_id": "batch-uuid",
                 "total_approved": 142,
@@ -395,6 +414,7 @@ class BatchExportResponse(BaseModel):
                 "created_at": "2025-11-19T12:00:00Z"
             }
         }
+    )
 
 
 # ==============================================================================
@@ -423,8 +443,8 @@ class UserRegistrationRequest(BaseModel):
     full_name: Optional[str] = Field(None, description="User full name")
     username: Optional[str] = Field(None, description="Optional username")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "john@example.com",
                 "password": "SecurePassword123!",
@@ -432,6 +452,7 @@ class UserRegistrationRequest(BaseModel):
                 "username": "johndoe"
             }
         }
+    )
 
 
 class UserLoginRequest(BaseModel):
@@ -439,13 +460,14 @@ class UserLoginRequest(BaseModel):
     email: str
     password: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "john@example.com",
                 "password": "SecurePassword123!"
             }
         }
+    )
 
 
 class UserResponse(BaseModel):
@@ -458,7 +480,7 @@ class UserResponse(BaseModel):
     account_status: str
     is_active: bool
     is_admin: bool
-    api_key: str
+    api_key: Optional[str] = None  # Only returned when the key is created or regenerated
     jobs_created_count: int = 0
     jobs_quota: int = 1000
     tokens_used: int = 0
@@ -466,9 +488,9 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "user-uuid",
                 "email": "john@example.com",
@@ -487,6 +509,7 @@ class UserResponse(BaseModel):
                 "created_at": "2025-11-01T10:00:00Z"
             }
         }
+    )
 
 
 class TokenResponse(BaseModel):
@@ -497,8 +520,8 @@ class TokenResponse(BaseModel):
     expires_in: int  # seconds
     user: 'UserResponse'
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -511,6 +534,7 @@ class TokenResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class RefreshTokenRequest(BaseModel):
@@ -522,10 +546,11 @@ class PasswordResetRequest(BaseModel):
     """Schema for password reset request."""
     email: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"email": "john@example.com"}
         }
+    )
 
 
 class PasswordResetConfirm(BaseModel):
@@ -533,13 +558,14 @@ class PasswordResetConfirm(BaseModel):
     reset_token: str
     new_password: str = Field(..., min_length=8)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reset_token": "reset-token-here",
                 "new_password": "NewSecurePassword123!"
             }
         }
+    )
 
 
 class UserUpdateRequest(BaseModel):
@@ -551,14 +577,15 @@ class UserUpdateRequest(BaseModel):
     tokens_quota: Optional[int] = None
     account_status: Optional[AccountStatus] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "full_name": "John Smith",
                 "role": "editor",
                 "jobs_quota": 2000
             }
         }
+    )
 
 
 class UserListResponse(BaseModel):
@@ -568,8 +595,8 @@ class UserListResponse(BaseModel):
     page: int
     page_size: int
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "users": [],
                 "total": 25,
@@ -577,6 +604,7 @@ class UserListResponse(BaseModel):
                 "page_size": 10
             }
         }
+    )
 
 
 class QuotaStatus(BaseModel):
@@ -589,8 +617,8 @@ class QuotaStatus(BaseModel):
     tokens_remaining: int
     quota_exceeded: bool
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "jobs_used": 42,
                 "jobs_quota": 1000,
@@ -601,3 +629,4 @@ class QuotaStatus(BaseModel):
                 "quota_exceeded": False
             }
         }
+    )
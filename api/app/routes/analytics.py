@@ -2,10 +2,11 @@
 Analytics and cost estimation routes.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
+import orjson
 
 from ..database import get_db
 from ..models.database import User, Job, JobResult
@@ -15,9 +16,64 @@ from ..models.schemas import (
 )
 from ..auth import get_current_user
 from ..core.bacowr_wrapper import bacowr
+from ..core.http_cache import etag_matches, weak_etag
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+_DAY = timedelta(days=1)
+
+# Static provider/strategy catalogue, encoded once instead of per request
+_PROVIDERS = {
+    "providers": [
+        {
+            "id": "anthropic",
+            "name": "Anthropic Claude",
+            "models": ["claude-3-haiku-20240307", "claude-3-sonnet-20240229", "claude-3-opus-20240229"],
+            "default_model": "claude-3-haiku-20240307",
+            "tested": True,
+            "available": True
+        },
+        {
+            "id": "openai",
+            "name": "OpenAI GPT",
+            "models": ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo"],
+            "default_model": "gpt-4o-mini",
+            "tested": False,
+            "available": True
+        },
+        {
+            "id": "google",
+            "name": "Google Gemini",
+            "models": ["gemini-1.5-flash", "gemini-1.5-pro"],
+            "default_model": "gemini-1.5-flash",
+            "tested": False,
+            "available": True
+        }
+    ],
+    "strategies": [
+        {
+            "id": "multi_stage",
+            "name": "Multi-Stage",
+            "description": "Best quality - 3 LLM calls (outline → content → polish)",
+            "estimated_time": "30-60 seconds",
+            "recommended": True
+        },
+        {
+            "id": "single_shot",
+            "name": "Single-Shot",
+            "description": "Fast - 1 LLM call with optimized prompt",
+            "estimated_time": "10-20 seconds",
+            "recommended": False
+        }
+    ]
+}
+_PROVIDERS_JSON = orjson.dumps(_PROVIDERS)
+_PROVIDERS_ETAG = weak_etag(_PROVIDERS_JSON)
+_PROVIDERS_HEADERS = {
+    "ETag": _PROVIDERS_ETAG,
+    "Cache-Control": "private, max-age=3600"
+}
+
 
 @router.post("/cost/estimate", response_model=CostEstimateResponse)
 def estimate_cost(
@@ -58,67 +114,64 @@ def get_analytics(
     Returns:
         Analytics including job counts, costs, success rates, etc.
     """
-    period_start = datetime.utcnow() - timedelta(days=days)
     period_end = datetime.utcnow()
+    period_start = period_end - days * _DAY
+
+    # Average generation time as a scalar subquery: joining JobResult
+    # would fan out the job counts and cost sums
+    avg_time_subquery = db.query(
+        func.avg(JobResult.generation_time_seconds)
+    ).filter(
+        JobResult.user_id == current_user.id,
+        JobResult.created_at >= period_start
+    ).scalar_subquery()
 
-    # Base query for jobs in period
-    jobs_query = db.query(Job).filter(
+    # One grouped aggregate over the user's jobs in the period; the
+    # per-status/provider/strategy breakdowns are folded from its rows
+    # (at most statuses x providers x strategies of them)
+    rows = db.query(
+        Job.status,
+        Job.llm_provider,
+        Job.writing_strategy,
+        func.count(Job.id),
+        func.sum(Job.actual_cost),
+        avg_time_subquery
+    ).filter(
         Job.user_id == current_user.id,
         Job.created_at >= period_start
-    )
-
-    # Total jobs
-    total_jobs = jobs_query.count()
-
-    # Jobs by status
-    jobs_by_status = {}
-    status_counts = jobs_query.with_entities(
+    ).group_by(
         Job.status,
-        func.count(Job.id)
-    ).group_by(Job.status).all()
-
-    for status, count in status_counts:
-        jobs_by_status[status] = count
+        Job.llm_provider,
+        Job.writing_strategy
+    ).all()
 
-    # Jobs by provider
+    total_jobs = 0
+    delivered_count = 0
+    total_cost = 0.0
+    jobs_by_status = {}
     jobs_by_provider = {}
-    provider_counts = jobs_query.filter(
-        Job.llm_provider.isnot(None)
-    ).with_entities(
-        Job.llm_provider,
-        func.count(Job.id)
-    ).group_by(Job.llm_provider).all()
+    jobs_by_strategy = {}
 
-    for provider, count in provider_counts:
-        jobs_by_provider[provider or "auto"] = count
+    for status, provider, strategy, count, cost, _ in rows:
+        total_jobs += count
+        total_cost += cost or 0.0
+        jobs_by_status[status] = jobs_by_status.get(status, 0) + count
 
-    # Jobs by strategy
-    jobs_by_strategy = {}
-    strategy_counts = jobs_query.filter(
-        Job.writing_strategy.isnot(None)
-    ).with_entities(
-        Job.writing_strategy,
-        func.count(Job.id)
-    ).group_by(Job.writing_strategy).all()
+        if status == JobStatus.DELIVERED:
+            delivered_count += count
 
-    for strategy, count in strategy_counts:
-        jobs_by_strategy[strategy] = count
+        if provider is not None:
+            jobs_by_provider[provider] = jobs_by_provider.get(provider, 0) + count
 
-    # Total cost
-    total_cost = db.query(func.sum(Job.actual_cost)).filter(
-        Job.user_id == current_user.id,
-        Job.created_at >= period_start,
-        Job.actual_cost.isnot(None)
-    ).scalar() or 0.0
+        if strategy is not None:
+            jobs_by_strategy[strategy] = jobs_by_strategy.get(strategy, 0) + count
 
-    # Average generation time
-    avg_time = db.query(func.avg(JobResult.generation_time_seconds)).filter(
-        JobResult.user_id == current_user.id,
-        JobResult.created_at >= period_start
-    ).scalar()
+    if rows:
+        avg_time = rows[0][-1]
+    else:
+        avg_time = db.query(avg_time_subquery).scalar()
 
     # Success rate
-    delivered_count = jobs_query.filter(Job.status == JobStatus.DELIVERED).count()
     success_rate = (delivered_count / total_jobs * 100) if total_jobs > 0 else 0.0
 
     return AnalyticsResponse(
@@ -136,6 +189,7 @@ def get_analytics(
 
 @router.get("/providers")
 def get_available_providers(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -143,47 +197,11 @@ def get_available_providers(
 
     Returns provider information including models and features.
     """
-    return {
-        "providers": [
-            {
-                "id": "anthropic",
-                "name": "Anthropic Claude",
-                "models": ["claude-3-haiku-20240307", "claude-3-sonnet-20240229", "claude-3-opus-20240229"],
-                "default_model": "claude-3-haiku-20240307",
-                "tested": True,
-                "available": True
-            },
-            {
-                "id": "openai",
-                "name": "OpenAI GPT",
-                "models": ["gpt-4o", "gpt-4o-mini", "gpt-4-turbo"],
-                "default_model": "gpt-4o-mini",
-                "tested": False,
-                "available": True
-            },
-            {
-                "id": "google",
-                "name": "Google Gemini",
-                "models": ["gemini-1.5-flash", "gemini-1.5-pro"],
-                "default_model": "gemini-1.5-flash",
-                "tested": False,
-                "available": True
-            }
-        ],
-        "strategies": [
-            {
-                "id": "multi_stage",
-                "name": "Multi-Stage",
-                "description": "Best quality - 3 LLM calls (outline → content → polish)",
-                "estimated_time": "30-60 seconds",
-                "recommended": True
-            },
-            {
-                "id": "single_shot",
-                "name": "Single-Shot",
-                "description": "Fast - 1 LLM call with optimized prompt",
-                "estimated_time": "10-20 seconds",
-                "recommended": False
-            }
-        ]
-    }
+    if etag_matches(request, _PROVIDERS_ETAG):
+        return Response(status_code=304, headers=_PROVIDERS_HEADERS)
+
+    return Response(
+        content=_PROVIDERS_JSON,
+        media_type="application/json",
+        headers=_PROVIDERS_HEADERS
+    )
@@ -5,20 +5,25 @@ Endpoints for viewing and searching audit logs (admin only).
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Integer, case, cast, func, select
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime, timedelta
+import orjson
 
-from ..database import get_db
+from ..database import get_db, SessionLocal
 from ..models.database import User
 from ..models.audit import AuditLog
 from ..auth import get_current_user
 from ..services.audit_service import AuditService
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
+_HOUR = timedelta(hours=1)
+
 
 # Response schemas
 class AuditLogResponse(BaseModel):
@@ -38,8 +43,11 @@ class AuditLogResponse(BaseModel):
     error_message: Optional[str]
     duration_ms: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Columns selected for streamed list responses (same shape as AuditLogResponse)
+_AUDIT_LIST_COLUMNS = [getattr(AuditLog, name) for name in AuditLogResponse.model_fields]
 
 
 class AuditLogDetailResponse(AuditLogResponse):
@@ -49,8 +57,7 @@ class AuditLogDetailResponse(AuditLogResponse):
     extra_data: Optional[dict]
     user_agent: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditStatsResponse(BaseModel):
@@ -64,8 +71,9 @@ class AuditStatsResponse(BaseModel):
     avg_duration_ms: Optional[float]
 
 
-# Admin check decorator
-def require_admin(current_user: User = Depends(get_current_user)):
+# Admin check dependency. Async because it does no I/O: FastAPI runs
+# plain-def dependencies in the threadpool, one hop per request.
+async def require_admin(current_user: User = Depends(get_current_user)):
     """Require admin privileges."""
     if not current_user.is_admin:
         raise HTTPException(
@@ -84,8 +92,7 @@ async def list_audit_logs(
     resource_type: Optional[str] = Query(None),
     status_filter: Optional[str] = Query(None, alias="status"),
     hours: Optional[int] = Query(None, ge=1, le=720),  # Max 30 days
-    current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """
     List audit logs (admin only).
@@ -99,35 +106,58 @@ async def list_audit_logs(
         status_filter: Filter by status
         hours: Look back N hours
         current_user: Current admin user
-        db: Database session
 
     Returns:
-        List of audit logs
+        List of audit logs, streamed as a JSON array
     """
-    query = db.query(AuditLog)
+    query = select(*_AUDIT_LIST_COLUMNS)
 
     # Apply filters
     if action:
-        query = query.filter(AuditLog.action == action)
+        query = query.where(AuditLog.action == action)
 
     if user_id:
-        query = query.filter(AuditLog.user_id == user_id)
+        query = query.where(AuditLog.user_id == user_id)
 
     if resource_type:
-        query = query.filter(AuditLog.resource_type == resource_type)
+        query = query.where(AuditLog.resource_type == resource_type)
 
     if status_filter:
-        query = query.filter(AuditLog.status == status_filter)
+        query = query.where(AuditLog.status == status_filter)
 
     if hours:
-        since = datetime.utcnow() - timedelta(hours=hours)
-        query = query.filter(AuditLog.timestamp >= since)
+        since = datetime.utcnow() - hours * _HOUR
+        query = query.where(AuditLog.timestamp >= since)
 
-    logs = query.order_by(
+    query = query.order_by(
         AuditLog.timestamp.desc()
-    ).limit(limit).offset(offset).all()
+    ).limit(limit).offset(offset)
 
-    return logs
+    return StreamingResponse(
+        _stream_json_array(query),
+        media_type="application/json"
+    )
+
+
+def _stream_json_array(query) -> Iterator[bytes]:
+    """
+    Encode query rows as a JSON array, one row at a time.
+
+    Uses its own session: the request session is closed before a
+    streaming body is sent.
+    """
+    db = SessionLocal()
+    try:
+        yield b"["
+        first = True
+        for row in db.execute(query).yield_per(500):
+            if not first:
+                yield b","
+            yield orjson.dumps(row._asdict())
+            first = False
+        yield b"]"
+    finally:
+        db.close()
 
 
 @router.get("/logs/{log_id}", response_model=AuditLogDetailResponse)
@@ -190,7 +220,7 @@ async def get_user_activity(
 
     start_date = None
     if hours:
-        start_date = datetime.utcnow() - timedelta(hours=hours)
+        start_date = datetime.utcnow() - hours * _HOUR
 
     logs = service.get_user_activity(
         user_id=user_id,
@@ -301,57 +331,57 @@ async def get_audit_stats(
     Returns:
         Audit statistics
     """
-    since = datetime.utcnow() - timedelta(hours=hours)
-
-    # Get all logs in time range
-    logs = db.query(AuditLog).filter(AuditLog.timestamp >= since).all()
-
-    # Calculate statistics
-    total_events = len(logs)
-
-    events_by_action = {}
-    events_by_user = {}
-    events_by_status = {}
-    failed_events = 0
-    security_events = 0
-    total_duration = 0
-    duration_count = 0
-
-    for log in logs:
-        # By action
-        events_by_action[log.action] = events_by_action.get(log.action, 0) + 1
-
-        # By user
-        user_key = log.user_email or log.user_id or "anonymous"
-        events_by_user[user_key] = events_by_user.get(user_key, 0) + 1
-
-        # By status
-        events_by_status[log.status] = events_by_status.get(log.status, 0) + 1
-
-        # Failed events
-        if log.status in ["failure", "error"]:
-            failed_events += 1
+    since = datetime.utcnow() - hours * _HOUR
+    in_range = AuditLog.timestamp >= since
+
+    # Totals in a single aggregate; the auth.% predicate matches the
+    # partial index so security events never need a Python-side check
+    totals = db.query(
+        func.count(AuditLog.id).label("total_events"),
+        func.sum(
+            case((AuditLog.status.in_(["failure", "error"]), 1), else_=0)
+        ).label("failed_events"),
+        func.sum(
+            case((AuditLog.action.like("auth.%"), 1), else_=0)
+        ).label("security_events"),
+        func.avg(
+            cast(func.nullif(AuditLog.duration_ms, ""), Integer)
+        ).label("avg_duration_ms")
+    ).filter(in_range).one()
+
+    events_by_action = dict(
+        db.query(AuditLog.action, func.count(AuditLog.id))
+        .filter(in_range)
+        .group_by(AuditLog.action)
+        .all()
+    )
 
-        # Security events
-        if log.action.startswith("auth."):
-            security_events += 1
+    user_key = func.coalesce(AuditLog.user_email, AuditLog.user_id, "anonymous")
+    events_by_user = dict(
+        db.query(user_key, func.count(AuditLog.id))
+        .filter(in_range)
+        .group_by(user_key)
+        .all()
+    )
 
-        # Duration
-        if log.duration_ms:
-            try:
-                total_duration += int(log.duration_ms)
-                duration_count += 1
-            except:
-                pass
+    events_by_status = dict(
+        db.query(AuditLog.status, func.count(AuditLog.id))
+        .filter(in_range)
+        .group_by(AuditLog.status)
+        .all()
+    )
 
-    avg_duration_ms = total_duration / duration_count if duration_count > 0 else None
+    avg_duration_ms = (
+        float(totals.avg_duration_ms)
+        if totals.avg_duration_ms is not None else None
+    )
 
     return AuditStatsResponse(
-        total_events=total_events,
+        total_events=totals.total_events,
         events_by_action=events_by_action,
         events_by_user=events_by_user,
         events_by_status=events_by_status,
-        failed_events=failed_events,
-        security_events=security_events,
+        failed_events=totals.failed_events or 0,
+        security_events=totals.security_events or 0,
         avg_duration_ms=avg_duration_ms
     )
@@ -5,11 +5,15 @@ Provides JWT-based authentication endpoints including registration,
 login, token refresh, and password reset.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 from datetime import timedelta
+import json
 
-from ..database import get_db
+from ..auth import get_user_cached
+from ..core.http_cache import cache_headers, etag_matches, not_modified, weak_etag
+from ..database import get_db, SessionLocal
+from ..models.database import User
 from ..models.schemas import (
     UserRegistrationRequest,
     UserLoginRequest,
@@ -27,6 +31,30 @@ from ..services.auth_service import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Same body whether or not the email exists (prevents email enumeration)
+_RESET_RESPONSE_BYTES = json.dumps({
+    "message": "If the email exists, a password reset link has been sent",
+    "detail": "Check your email for reset instructions"
+}).encode("utf-8")
+
+
+# Access token lifetime in seconds, as reported in TokenResponse.expires_in
+_EXPIRES_IN = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+def _token_response(user: User) -> TokenResponse:
+    """Issue a fresh token pair for user."""
+    access_token, refresh_token = AuthService.create_token_pair(user.id)
+
+    # All fields are produced here, so skip validating them again
+    return TokenResponse.model_construct(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        expires_in=_EXPIRES_IN,
+        user=UserResponse.model_validate(user)
+    )
+
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -47,7 +75,7 @@ async def register(
     Returns tokens and user information.
     """
     # Create user (default role is viewer)
-    user = AuthService.register_user(
+    user = await AuthService.register_user(
         email=user_data.email,
         password=user_data.password,
         full_name=user_data.full_name,
@@ -56,17 +84,7 @@ async def register(
         db=db
     )
 
-    # Generate tokens
-    access_token = AuthService.create_access_token(data={"sub": user.id})
-    refresh_token = AuthService.create_refresh_token(data={"sub": user.id})
-
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
-        expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse.model_validate(user)
-    )
+    return _token_response(user)
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -84,7 +102,7 @@ async def login(
 
     Returns tokens and user information.
     """
-    user = AuthService.authenticate_user(
+    user = await AuthService.authenticate_user(
         email=credentials.email,
         password=credentials.password,
         db=db
@@ -103,17 +121,7 @@ async def login(
             detail="Account is inactive"
         )
 
-    # Generate tokens
-    access_token = AuthService.create_access_token(data={"sub": user.id})
-    refresh_token = AuthService.create_refresh_token(data={"sub": user.id})
-
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer",
-        expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse.model_validate(user)
-    )
+    return _token_response(user)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -140,9 +148,8 @@ async def refresh_token(
             detail="Invalid refresh token"
         )
 
-    # Get user
-    from ..models.database import User
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user (cached for a short TTL)
+    user = get_user_cached(user_id, db)
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -150,37 +157,47 @@ async def refresh_token(
             detail="User not found or inactive"
         )
 
-    # Generate new tokens
-    access_token = AuthService.create_access_token(data={"sub": user.id})
-    new_refresh_token = AuthService.create_refresh_token(data={"sub": user.id})
-
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=new_refresh_token,
-        token_type="bearer",
-        expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        user=UserResponse.model_validate(user)
-    )
+    return _token_response(user)
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
+    request: Request,
+    response: Response,
     current_user = Depends(get_current_user_jwt)
 ):
     """
     Get current user information.
 
     Returns the profile information for the currently authenticated user.
+    Supports If-None-Match: an unchanged profile returns 304 with no body.
 
     Requires: Bearer token in Authorization header
     """
+    # updated_at is bumped on every profile write, but SQLite stores it with
+    # second precision, so the fields that change most often are hashed too
+    last_modified = current_user.updated_at or current_user.created_at
+    etag = weak_etag(
+        current_user.id,
+        last_modified.isoformat() if last_modified else None,
+        current_user.role,
+        current_user.account_status,
+        current_user.is_active,
+        current_user.jobs_created_count,
+        current_user.tokens_used
+    )
+
+    if etag_matches(request, etag):
+        return not_modified(etag, last_modified)
+
+    response.headers.update(cache_headers(etag, last_modified))
     return UserResponse.model_validate(current_user)
 
 
 @router.post("/password-reset/request")
 async def request_password_reset(
     reset_request: PasswordResetRequest,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks
 ):
     """
     Request password reset.
@@ -192,19 +209,24 @@ async def request_password_reset(
 
     Returns success message (always returns success to prevent email enumeration).
     """
-    from ..models.database import User
-    user = db.query(User).filter(User.email == reset_request.email).first()
+    # The lookup runs after the response is sent, so response time does not
+    # depend on whether the email exists
+    background_tasks.add_task(_process_password_reset, reset_request.email)
 
-    if user:
-        reset_token = AuthService.generate_reset_token(user, db)
-        # TODO: Send email with reset link containing reset_token
-        # For now, we just return success (in production, always return success
-        # to prevent email enumeration attacks)
+    return Response(content=_RESET_RESPONSE_BYTES, media_type="application/json")
 
-    return {
-        "message": "If the email exists, a password reset link has been sent",
-        "detail": "Check your email for reset instructions"
-    }
+
+def _process_password_reset(email: str) -> None:
+    """Generate a reset token for the user with this email, if any."""
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+
+        if user:
+            reset_token = AuthService.generate_reset_token(user, db)
+            # TODO: Send email with reset link containing reset_token
+    finally:
+        db.close()
 
 
 @router.post("/password-reset/confirm")
@@ -222,7 +244,7 @@ async def confirm_password_reset(
 
     Returns success message.
     """
-    success = AuthService.reset_password(
+    success = await AuthService.reset_password(
         reset_token=reset_data.reset_token,
         new_password=reset_data.new_password,
         db=db
@@ -2,21 +2,52 @@
 Backlinks routes for managing historical backlinks.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
-
-from ..database import get_db
+from sqlalchemy import cast, exists, func, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime
+from typing import List, Optional, Tuple
+from urllib.parse import urlencode
+from pydantic import TypeAdapter
+
+from ..database import get_db, get_async_db
 from ..models.database import User, Backlink
 from ..models.schemas import (
     BacklinkCreate, BacklinkBulkImport, BacklinkResponse,
     BacklinkStats, PaginatedResponse
 )
 from ..auth import get_current_user
+from ..core.http_cache import cache_headers, etag_matches, not_modified, weak_etag
+from ..core.pagination import decode_cursor, encode_cursor, keyset_before
 
 router = APIRouter(prefix="/backlinks", tags=["backlinks"])
 
+# Validates a whole page of rows in one pydantic-core call
+_BACKLINK_LIST = TypeAdapter(List[BacklinkResponse])
+
+# Text matched by ?search=. Kept identical to the expression of the
+# ix_backlink_search_trgm GIN index (models/database.py) so PostgreSQL can
+# serve ILIKE from it.
+_SEARCH_DOCUMENT = (
+    Backlink.anchor_text
+    + literal_column("' '")
+    + Backlink.publisher_domain
+    + literal_column("' '")
+    + func.coalesce(Backlink.target_url, literal_column("''"))
+)
+
+
+def _tag_filter(dialect_name: str, tag: str):
+    """Filter for backlinks whose tags array contains tag."""
+    if dialect_name == "postgresql":
+        # Containment on the jsonb cast is served by ix_backlink_tags_gin
+        return cast(Backlink.tags, JSONB).contains([tag])
+
+    tag_values = func.json_each(Backlink.tags).table_valued("value")
+    return exists().where(tag_values.c.value == tag)
+
 
 @router.post("", response_model=BacklinkResponse, status_code=status.HTTP_201_CREATED)
 def create_backlink(
@@ -48,32 +79,35 @@ def bulk_import_backlinks(
 
     Maximum 1000 backlinks per request.
     """
-    backlinks = []
-    for backlink_data in bulk_import.backlinks:
-        backlink = Backlink(
-            user_id=current_user.id,
-            **backlink_data.model_dump()
-        )
-        backlinks.append(backlink)
-
-    db.bulk_save_objects(backlinks)
+    # Plain dicts through a Core-style INSERT: no ORM instances, and the
+    # driver batches the rows into multi-row INSERTs (insertmanyvalues)
+    rows = [
+        {"user_id": current_user.id, **backlink_data.model_dump()}
+        for backlink_data in bulk_import.backlinks
+    ]
+
+    db.execute(insert(Backlink), rows)
     db.commit()
 
     return {
-        "imported_count": len(backlinks),
-        "message": f"Successfully imported {len(backlinks)} backlinks"
+        "imported_count": len(rows),
+        "message": f"Successfully imported {len(rows)} backlinks"
     }
 
 
 @router.get("", response_model=PaginatedResponse)
-def list_backlinks(
+async def list_backlinks(
+    request: Request,
+    response: Response,
     page: int = 1,
     page_size: int = 20,
     publisher_domain: Optional[str] = None,
     category: Optional[str] = None,
     language: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    tag: Optional[str] = None,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -84,47 +118,105 @@ def list_backlinks(
     - category: Filter by category
     - language: Filter by language
     - search: Search in anchor text, publisher domain, or target URL
+    - tag: Only backlinks tagged with this value
+
+    Pagination:
+    - page/page_size: Offset pagination
+    - cursor: Pass the previous response's next_cursor instead of page to
+      read the next page by key (constant cost for deep pages)
+
+    Supports If-None-Match: returns 304 with no body while the user's
+    backlinks are unchanged (the ETag is per page and filter set).
     """
-    query = db.query(Backlink).filter(Backlink.user_id == current_user.id)
+    etag, last_modified = await _backlinks_version(db, request, current_user.id)
+    if etag_matches(request, etag):
+        return not_modified(etag, last_modified)
+    response.headers.update(cache_headers(etag, last_modified))
+
+    filters = [Backlink.user_id == current_user.id]
 
     # Apply filters
     if publisher_domain:
-        query = query.filter(Backlink.publisher_domain == publisher_domain)
+        filters.append(Backlink.publisher_domain == publisher_domain)
 
     if category:
-        query = query.filter(Backlink.category == category)
+        filters.append(Backlink.category == category)
 
     if language:
-        query = query.filter(Backlink.language == language)
+        filters.append(Backlink.language == language)
 
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
-            (Backlink.anchor_text.ilike(search_term)) |
-            (Backlink.publisher_domain.ilike(search_term)) |
-            (Backlink.target_url.ilike(search_term))
+        filters.append(_SEARCH_DOCUMENT.ilike(search_term))
+
+    if tag:
+        filters.append(_tag_filter(db.bind.dialect.name, tag))
+
+    # page_size + 1 rows: the extra one tells whether there is a next page
+    query = select(Backlink).where(*filters).order_by(
+        Backlink.created_at.desc(),
+        Backlink.id.desc()
+    ).limit(page_size + 1)
+
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # Keyset page: the total comes from a scalar subquery since a
+        # window count would only see rows after the cursor
+        total_subquery = select(func.count(Backlink.id)).where(*filters).scalar_subquery()
+        query = query.add_columns(total_subquery.label("total")).where(
+            keyset_before(
+                db.bind.dialect.name,
+                Backlink.created_at, Backlink.id,
+                cursor_created_at, cursor_id
+            )
+        )
+    else:
+        # Page and total in one round trip: COUNT(*) OVER () is evaluated
+        # before OFFSET/LIMIT, so every row carries the full match count
+        query = query.add_columns(func.count().over().label("total")).offset(
+            (page - 1) * page_size
         )
 
-    # Count total
-    total = query.count()
+    rows = (await db.execute(query)).all()
+
+    if rows:
+        total = rows[0].total
+    elif page > 1 or cursor:
+        # Past the last page there are no rows to read the total from
+        total = (await db.execute(
+            select(func.count(Backlink.id)).where(*filters)
+        )).scalar_one()
+    else:
+        total = 0
+
+    backlinks = [row.Backlink for row in rows[:page_size]]
 
-    # Paginate
-    backlinks = query.order_by(Backlink.created_at.desc())\
-        .offset((page - 1) * page_size)\
-        .limit(page_size)\
-        .all()
+    next_cursor = None
+    if len(rows) > page_size:
+        last = backlinks[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
 
     return PaginatedResponse.create(
-        items=[BacklinkResponse.model_validate(b) for b in backlinks],
+        items=_BACKLINK_LIST.validate_python(backlinks, from_attributes=True),
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/stats", response_model=BacklinkStats)
-def get_backlinks_stats(
-    db: Session = Depends(get_db),
+async def get_backlinks_stats(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -135,65 +227,37 @@ def get_backlinks_stats(
     - Breakdown by publisher, category, language
     - Average domain/page authority
     - Total traffic estimate
+
+    Supports If-None-Match like the listing.
     """
-    # Total count
-    total_count = db.query(Backlink).filter(Backlink.user_id == current_user.id).count()
-
-    # By publisher
-    by_publisher = {}
-    publisher_counts = db.query(
-        Backlink.publisher_domain,
-        func.count(Backlink.id)
-    ).filter(
-        Backlink.user_id == current_user.id
-    ).group_by(Backlink.publisher_domain).all()
-
-    for domain, count in publisher_counts:
-        by_publisher[domain] = count
-
-    # By category
-    by_category = {}
-    category_counts = db.query(
-        Backlink.category,
-        func.count(Backlink.id)
-    ).filter(
-        Backlink.user_id == current_user.id,
-        Backlink.category.isnot(None)
-    ).group_by(Backlink.category).all()
-
-    for category, count in category_counts:
-        by_category[category or "uncategorized"] = count
-
-    # By language
-    by_language = {}
-    language_counts = db.query(
-        Backlink.language,
-        func.count(Backlink.id)
-    ).filter(
-        Backlink.user_id == current_user.id,
-        Backlink.language.isnot(None)
-    ).group_by(Backlink.language).all()
-
-    for lang, count in language_counts:
-        by_language[lang or "unknown"] = count
-
-    # Average domain authority
-    avg_da = db.query(func.avg(Backlink.domain_authority)).filter(
-        Backlink.user_id == current_user.id,
-        Backlink.domain_authority.isnot(None)
-    ).scalar()
-
-    # Average page authority
-    avg_pa = db.query(func.avg(Backlink.page_authority)).filter(
-        Backlink.user_id == current_user.id,
-        Backlink.page_authority.isnot(None)
-    ).scalar()
-
-    # Total traffic estimate
-    total_traffic = db.query(func.sum(Backlink.traffic_estimate)).filter(
-        Backlink.user_id == current_user.id,
-        Backlink.traffic_estimate.isnot(None)
-    ).scalar()
+    etag, last_modified = await _backlinks_version(db, request, current_user.id)
+    if etag_matches(request, etag):
+        return not_modified(etag, last_modified)
+    response.headers.update(cache_headers(etag, last_modified))
+
+    # Count, authority averages and traffic total in one round trip
+    # (AVG/SUM skip NULLs, matching the old IS NOT NULL filters)
+    total_count, avg_da, avg_pa, total_traffic = (await db.execute(
+        select(
+            func.count(Backlink.id),
+            func.avg(Backlink.domain_authority),
+            func.avg(Backlink.page_authority),
+            func.sum(Backlink.traffic_estimate)
+        ).where(
+            Backlink.user_id == current_user.id
+        )
+    )).one()
+
+    # Breakdowns: plain (key, count) pairs read straight off the driver cursor
+    by_publisher = await _grouped_counts(db, "publisher_domain", current_user.id)
+    by_category = await _grouped_counts(
+        db, "COALESCE(NULLIF(category, ''), 'uncategorized')", current_user.id,
+        where="category IS NOT NULL"
+    )
+    by_language = await _grouped_counts(
+        db, "COALESCE(NULLIF(language, ''), 'unknown')", current_user.id,
+        where="language IS NOT NULL"
+    )
 
     return BacklinkStats(
         total_count=total_count,
@@ -206,6 +270,66 @@ def get_backlinks_stats(
     )
 
 
+async def _backlinks_version(
+    db: AsyncSession,
+    request: Request,
+    user_id: str
+) -> Tuple[str, Optional[datetime]]:
+    """
+    ETag and Last-Modified for a user's backlinks as seen by this request.
+
+    Backlinks are only ever inserted or deleted, so (count, newest
+    created_at) changes on every write. Served from the
+    (user_id, created_at, id) index without touching the table.
+
+    The endpoint path and the sorted query parameters (page, cursor,
+    filters) are part of the ETag, so one page's validator never matches
+    another page, filter or the stats view.
+    """
+    count, newest = (await db.execute(
+        select(func.count(Backlink.id), func.max(Backlink.created_at)).where(
+            Backlink.user_id == user_id
+        )
+    )).one()
+
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return weak_etag(request.url.path, query, user_id, count, newest), newest
+
+
+# DB-API placeholder for each driver paramstyle
+_PLACEHOLDERS = {
+    "qmark": "?",
+    "format": "%s",
+    "pyformat": "%s",
+    "numeric": ":1",
+    "numeric_dollar": "$1",
+}
+
+
+async def _grouped_counts(
+    db: AsyncSession,
+    key_sql: str,
+    user_id: str,
+    where: Optional[str] = None
+) -> dict:
+    """
+    Count a user's backlinks grouped by a SQL expression.
+
+    Runs through exec_driver_sql so rows skip SQLAlchemy result processing;
+    key_sql and where must be trusted constants, never request input.
+    """
+    placeholder = _PLACEHOLDERS[db.bind.dialect.paramstyle]
+    conditions = f"user_id = {placeholder}" + (f" AND {where}" if where else "")
+
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(
+        f"SELECT {key_sql}, count(*) FROM backlinks WHERE {conditions} GROUP BY 1",
+        (user_id,)
+    )
+
+    return dict(result.fetchall())
+
+
 @router.get("/{backlink_id}", response_model=BacklinkResponse)
 def get_backlink(
     backlink_id: str,
@@ -213,12 +337,10 @@ def get_backlink(
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific backlink by ID."""
-    backlink = db.query(Backlink).filter(
-        Backlink.id == backlink_id,
-        Backlink.user_id == current_user.id
-    ).first()
+    backlink = db.get(Backlink, backlink_id)
 
-    if not backlink:
+    # Treat other users' backlinks as missing
+    if not backlink or backlink.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backlink not found"
@@ -234,12 +356,10 @@ def delete_backlink(
     current_user: User = Depends(get_current_user)
 ):
     """Delete a backlink."""
-    backlink = db.query(Backlink).filter(
-        Backlink.id == backlink_id,
-        Backlink.user_id == current_user.id
-    ).first()
+    backlink = db.get(Backlink, backlink_id)
 
-    if not backlink:
+    # Treat other users' backlinks as missing
+    if not backlink or backlink.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backlink not found"
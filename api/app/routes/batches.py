@@ -8,41 +8,82 @@ Endpoints for Day 2 QA workflow:
 - Export approved batches
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from typing import List, Optional
-
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from typing import Iterator, List, Literal, Optional
+import csv
+import io
+import orjson
+import os
+
+from ..database import get_db, get_async_db, SessionLocal
 from ..models.schemas import (
     BatchCreate,
     BatchResponse,
     BatchDetailResponse,
     BatchItemResponse,
     ReviewDecisionRequest,
-    BatchExportResponse,
-    JobDetailResponse
+    BulkReviewRequest,
+    BatchExportResponse
 )
-from ..models.database import Batch, BatchReviewItem, Job, User
-from ..services.batch_review import BatchReviewService
+from ..models.database import Batch, BatchReviewItem, User
+from ..services.batch_review import BatchReviewService, EXPORT_FIELDS
 from ..auth import get_current_user
+from ..core.cache import cache
+from ..middleware.prometheus import track_cache_lookup
 
 router = APIRouter(prefix="/batches", tags=["batches"])
 
+# Allowed export formats; validated by set membership rather than a regex
+ExportFormat = Literal["json", "csv"]
+DownloadFormat = Literal["ndjson", "csv"]
 
-@router.post("", response_model=BatchResponse, status_code=status.HTTP_201_CREATED)
-async def create_batch(
-    batch_data: BatchCreate,
+# Validates a whole page of items in one pydantic-core call
+_BATCH_ITEM_LIST = TypeAdapter(List[BatchItemResponse])
+
+# Batch detail and stats are polled by the review UI but only change on
+# review writes, which drop the cached entries
+BATCH_CACHE_TTL_SECONDS = int(os.getenv("BATCH_CACHE_TTL_SECONDS", "15"))
+
+
+def _batch_cache_key(user_id: str, batch_id: str, view: str) -> str:
+    return f"batch:{user_id}:{batch_id}:{view}"
+
+
+def _invalidate_batch_cache(user_id: str, batch_id: str) -> None:
+    cache.delete(
+        _batch_cache_key(user_id, batch_id, "detail"),
+        _batch_cache_key(user_id, batch_id, "stats")
+    )
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def get_batch_service(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
+) -> BatchReviewService:
+    """One BatchReviewService per request, shared by the route and its helpers."""
+    return BatchReviewService(db, current_user.id)
+
+
+@router.post("", response_model=BatchResponse, status_code=status.HTTP_201_CREATED)
+def create_batch(
+    batch_data: BatchCreate,
+    service: BatchReviewService = Depends(get_batch_service)
 ):
     """
     Create a new batch from completed jobs.
 
     Args:
         batch_data: Batch creation data
-        current_user: Current authenticated user
-        db: Database session
+        service: Batch review service for the current user
 
     Returns:
         Created batch
@@ -51,8 +92,6 @@ async def create_batch(
         400: If jobs invalid or not completed
         404: If jobs not found
     """
-    service = BatchReviewService(db, current_user.id)
-
     try:
         batch = service.create_batch_from_jobs(
             name=batch_data.name,
@@ -75,7 +114,7 @@ async def list_batches(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List all batches for current user.
@@ -90,14 +129,14 @@ async def list_batches(
     Returns:
         List of batches
     """
-    query = db.query(Batch).filter(Batch.user_id == current_user.id)
+    query = select(Batch).where(Batch.user_id == current_user.id)
 
     if status_filter:
-        query = query.filter(Batch.status == status_filter)
+        query = query.where(Batch.status == status_filter)
 
-    batches = query.order_by(
-        Batch.created_at.desc()
-    ).limit(limit).offset(offset).all()
+    batches = (await db.execute(
+        query.order_by(Batch.created_at.desc()).limit(limit).offset(offset)
+    )).scalars().all()
 
     return batches
 
@@ -106,7 +145,7 @@ async def list_batches(
 async def get_batch(
     batch_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get batch details with all items.
@@ -122,8 +161,28 @@ async def get_batch(
     Raises:
         404: If batch not found
     """
-    service = BatchReviewService(db, current_user.id)
-    batch = service.get_batch(batch_id)
+    cache_key = _batch_cache_key(current_user.id, batch_id, "detail")
+    cached = cache.get(cache_key)
+    track_cache_lookup("get_batch", cached is not None)
+    if cached is not None:
+        return _json_response(cached)
+
+    # One query for the owned batch, one for its items joined to their jobs
+    # (selectinload avoids repeating the batch columns on every item row).
+    # raiseload makes any other relationship access fail instead of lazy
+    # loading one query per item.
+    batch = (await db.execute(
+        select(Batch).options(
+            selectinload(Batch.items).options(
+                joinedload(BatchReviewItem.job).raiseload("*"),
+                raiseload("*")
+            ),
+            raiseload("*")
+        ).where(
+            Batch.id == batch_id,
+            Batch.user_id == current_user.id
+        )
+    )).scalar_one_or_none()
 
     if not batch:
         raise HTTPException(
@@ -131,24 +190,21 @@ async def get_batch(
             detail=f"Batch not found: {batch_id}"
         )
 
-    # Load items (eagerly to avoid N+1 queries)
-    batch = db.query(Batch).options(
-        joinedload(Batch.items).joinedload(BatchReviewItem.job)
-    ).filter(Batch.id == batch_id).first()
+    body = BatchDetailResponse.model_validate(batch).model_dump_json().encode("utf-8")
+    cache.set(cache_key, body, BATCH_CACHE_TTL_SECONDS)
 
-    return batch
+    return _json_response(body)
 
 
 @router.get("/{batch_id}/items", response_model=List[BatchItemResponse])
-async def get_batch_items(
+def get_batch_items(
     batch_id: str,
     review_status: Optional[str] = Query(None),
     min_qc_score: Optional[float] = Query(None, ge=0, le=1),
     max_qc_score: Optional[float] = Query(None, ge=0, le=1),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    service: BatchReviewService = Depends(get_batch_service)
 ):
     """
     Get batch items with filtering.
@@ -160,8 +216,7 @@ async def get_batch_items(
         max_qc_score: Maximum QC score filter
         limit: Max items to return
         offset: Offset for pagination
-        current_user: Current authenticated user
-        db: Database session
+        service: Batch review service for the current user
 
     Returns:
         List of batch items
@@ -169,8 +224,6 @@ async def get_batch_items(
     Raises:
         404: If batch not found
     """
-    service = BatchReviewService(db, current_user.id)
-
     # Verify batch exists
     batch = service.get_batch(batch_id)
     if not batch:
@@ -188,28 +241,17 @@ async def get_batch_items(
         offset=offset
     )
 
-    # Eagerly load job data for each item
-    items_with_jobs = []
-    for item in items:
-        item_dict = BatchItemResponse.from_orm(item).dict()
-
-        # Load job details
-        job = db.query(Job).filter(Job.id == item.job_id).first()
-        if job:
-            item_dict['job'] = JobDetailResponse.from_orm(job)
-
-        items_with_jobs.append(BatchItemResponse(**item_dict))
-
-    return items_with_jobs
+    # item.job is eager-loaded by the service query
+    return _BATCH_ITEM_LIST.validate_python(items, from_attributes=True)
 
 
 @router.post("/{batch_id}/items/{item_id}/review", response_model=BatchItemResponse)
-async def review_item(
+def review_item(
     batch_id: str,
     item_id: str,
     decision: ReviewDecisionRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    service: BatchReviewService = Depends(get_batch_service)
 ):
     """
     Review a batch item (approve, reject, or request regeneration).
@@ -219,7 +261,7 @@ async def review_item(
         item_id: Item ID
         decision: Review decision
         current_user: Current authenticated user
-        db: Database session
+        service: Batch review service for the current user
 
     Returns:
         Updated batch item
@@ -228,8 +270,6 @@ async def review_item(
         400: If item already reviewed or invalid decision
         404: If batch or item not found
     """
-    service = BatchReviewService(db, current_user.id)
-
     try:
         if decision.decision == "approved":
             item = service.approve_item(
@@ -255,6 +295,7 @@ async def review_item(
                 detail=f"Invalid decision: {decision.decision}"
             )
 
+        _invalidate_batch_cache(current_user.id, batch_id)
         return item
 
     except ValueError as e:
@@ -264,12 +305,54 @@ async def review_item(
         )
 
 
+@router.post("/{batch_id}/items/bulk_review", response_model=BatchResponse)
+def bulk_review_items(
+    batch_id: str,
+    review: BulkReviewRequest,
+    current_user: User = Depends(get_current_user),
+    service: BatchReviewService = Depends(get_batch_service)
+):
+    """
+    Review many batch items in one request.
+
+    All decisions are applied in a single transaction, or none are.
+
+    Args:
+        batch_id: Batch ID
+        review: Item decisions (max 1000)
+        current_user: Current authenticated user
+        service: Batch review service for the current user
+
+    Returns:
+        Updated batch with new review counters
+
+    Raises:
+        400: If batch or any item not found, or any decision invalid
+    """
+    try:
+        batch = service.bulk_review(
+            batch_id=batch_id,
+            decisions=[
+                (item.item_id, item.decision.value, item.reviewer_notes)
+                for item in review.items
+            ]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    _invalidate_batch_cache(current_user.id, batch_id)
+    return batch
+
+
 @router.post("/{batch_id}/items/{item_id}/regenerate", response_model=BatchItemResponse)
 async def execute_regeneration(
     batch_id: str,
     item_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    service: BatchReviewService = Depends(get_batch_service)
 ):
     """
     Execute regeneration for a batch item.
@@ -280,7 +363,7 @@ async def execute_regeneration(
         batch_id: Batch ID
         item_id: Item ID
         current_user: Current authenticated user
-        db: Database session
+        service: Batch review service for the current user
 
     Returns:
         Updated batch item with new job
@@ -289,13 +372,12 @@ async def execute_regeneration(
         400: If item not in needs_regeneration status
         404: If batch or item not found
     """
-    service = BatchReviewService(db, current_user.id)
-
     try:
         item = await service.execute_regeneration(
             batch_id=batch_id,
             item_id=item_id
         )
+        _invalidate_batch_cache(current_user.id, batch_id)
         return item
 
     except ValueError as e:
@@ -306,11 +388,10 @@ async def execute_regeneration(
 
 
 @router.post("/{batch_id}/export", response_model=BatchExportResponse)
-async def export_batch(
+def export_batch(
     batch_id: str,
-    export_format: str = Query("json", regex="^(json|csv)$"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    export_format: ExportFormat = Query("json"),
+    service: BatchReviewService = Depends(get_batch_service)
 ):
     """
     Export all approved items from a batch.
@@ -318,8 +399,7 @@ async def export_batch(
     Args:
         batch_id: Batch ID
         export_format: Export format (json or csv)
-        current_user: Current authenticated user
-        db: Database session
+        service: Batch review service for the current user
 
     Returns:
         Export metadata with file path
@@ -328,8 +408,6 @@ async def export_batch(
         400: If no approved items
         404: If batch not found
     """
-    service = BatchReviewService(db, current_user.id)
-
     try:
         export_data = service.export_approved_batch(
             batch_id=batch_id,
@@ -344,11 +422,96 @@ async def export_batch(
         )
 
 
+@router.get("/{batch_id}/download")
+def download_batch(
+    batch_id: str,
+    export_format: DownloadFormat = Query("ndjson"),
+    current_user: User = Depends(get_current_user),
+    service: BatchReviewService = Depends(get_batch_service)
+):
+    """
+    Stream all approved items from a batch.
+
+    Items are read and encoded in chunks, so the first bytes go out
+    immediately and memory does not grow with batch size.
+
+    Args:
+        batch_id: Batch ID
+        export_format: Export format (ndjson or csv)
+        current_user: Current authenticated user
+        service: Batch review service for the current user
+
+    Returns:
+        Streaming NDJSON (one item per line) or CSV body
+
+    Raises:
+        404: If batch not found
+    """
+    if not service.get_batch(batch_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch not found: {batch_id}"
+        )
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream_approved_items(current_user.id, batch_id, export_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="batch_{batch_id}_approved.{export_format}"'
+        }
+    )
+
+
+# Items encoded per chunk of the streamed export
+_EXPORT_CHUNK_ITEMS = 1000
+
+
+def _stream_approved_items(user_id: str, batch_id: str, export_format: str) -> Iterator[bytes]:
+    """
+    Encode a batch's approved items chunk by chunk.
+
+    Uses its own session: the request session is closed before a
+    streaming body is sent.
+    """
+    db = SessionLocal()
+    try:
+        records = BatchReviewService(db, user_id).iter_approved_items(
+            batch_id, chunk_size=_EXPORT_CHUNK_ITEMS
+        )
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            for count, record in enumerate(records, 1):
+                if record["job_package"] is not None:
+                    record["job_package"] = orjson.dumps(record["job_package"]).decode("utf-8")
+                writer.writerow(record)
+                if count % _EXPORT_CHUNK_ITEMS == 0:
+                    yield buffer.getvalue().encode("utf-8")
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue().encode("utf-8")
+        else:
+            lines = []
+            for record in records:
+                lines.append(orjson.dumps(record))
+                if len(lines) == _EXPORT_CHUNK_ITEMS:
+                    yield b"\n".join(lines) + b"\n"
+                    lines.clear()
+            if lines:
+                yield b"\n".join(lines) + b"\n"
+    finally:
+        db.close()
+
+
 @router.get("/{batch_id}/stats")
-async def get_batch_stats(
+def get_batch_stats(
     batch_id: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    service: BatchReviewService = Depends(get_batch_service)
 ):
     """
     Get batch statistics and analytics.
@@ -356,7 +519,7 @@ async def get_batch_stats(
     Args:
         batch_id: Batch ID
         current_user: Current authenticated user
-        db: Database session
+        service: Batch review service for the current user
 
     Returns:
         Batch statistics
@@ -364,7 +527,12 @@ async def get_batch_stats(
     Raises:
         404: If batch not found
     """
-    service = BatchReviewService(db, current_user.id)
+    cache_key = _batch_cache_key(current_user.id, batch_id, "stats")
+    cached = cache.get(cache_key)
+    track_cache_lookup("get_batch_stats", cached is not None)
+    if cached is not None:
+        return _json_response(cached)
+
     batch = service.get_batch(batch_id)
 
     if not batch:
@@ -373,50 +541,45 @@ async def get_batch_stats(
             detail=f"Batch not found: {batch_id}"
         )
 
-    # Get QC distribution
-    qc_distribution = db.query(
-        BatchReviewItem.qc_status,
-        func.count(BatchReviewItem.id)
-    ).filter(
-        BatchReviewItem.batch_id == batch_id
-    ).group_by(
-        BatchReviewItem.qc_status
-    ).all()
-
-    # Get review status distribution
-    review_distribution = db.query(
-        BatchReviewItem.review_status,
-        func.count(BatchReviewItem.id)
-    ).filter(
-        BatchReviewItem.batch_id == batch_id
-    ).group_by(
-        BatchReviewItem.review_status
-    ).all()
-
-    # Get average QC score
-    avg_qc_score = db.query(
-        func.avg(BatchReviewItem.qc_score)
-    ).filter(
-        BatchReviewItem.batch_id == batch_id
-    ).scalar()
-
-    return {
+    # QC and review distributions plus the score average from the per-group
+    # counts; the (qc_status, review_status) groups are few, so fold in Python
+    groups = service.get_review_groups(batch_id)
+
+    qc_distribution = {}
+    review_distribution = {}
+    score_sum = 0.0
+    scored_count = 0
+    for qc_status, review_status, count, group_score_sum, group_scored in groups:
+        qc_distribution[qc_status] = qc_distribution.get(qc_status, 0) + count
+        review_distribution[review_status] = review_distribution.get(review_status, 0) + count
+        score_sum += group_score_sum or 0
+        scored_count += group_scored
+
+    avg_qc_score = score_sum / scored_count if scored_count else None
+
+    # Counters come from the items themselves rather than the running totals
+    # on the batch row, so they cannot drift from what the distributions show
+    total_items = sum(review_distribution.values())
+    items_approved = review_distribution.get("approved", 0)
+    items_rejected = review_distribution.get("rejected", 0)
+    items_reviewed = items_approved + items_rejected
+
+    stats = {
         "batch_id": batch.id,
-        "total_items": batch.total_items,
-        "items_approved": batch.items_approved,
-        "items_rejected": batch.items_rejected,
-        "items_pending_review": batch.items_pending_review,
+        "total_items": total_items,
+        "items_approved": items_approved,
+        "items_rejected": items_rejected,
+        "items_pending_review": total_items - items_reviewed,
         "avg_qc_score": float(avg_qc_score) if avg_qc_score else None,
-        "qc_status_distribution": {
-            status: count for status, count in qc_distribution
-        },
-        "review_status_distribution": {
-            status: count for status, count in review_distribution
-        },
+        "qc_status_distribution": qc_distribution,
+        "review_status_distribution": review_distribution,
         "estimated_total_cost": batch.estimated_total_cost,
         "actual_total_cost": batch.actual_total_cost,
-        "completion_rate": (
-            (batch.items_approved + batch.items_rejected) / batch.total_items * 100
-            if batch.total_items > 0 else 0
-        )
+        "completion_rate": items_reviewed / total_items * 100 if total_items else 0
     }
+
+    # qc_status may be NULL for items not yet scored
+    body = orjson.dumps(stats, option=orjson.OPT_NON_STR_KEYS)
+    cache.set(cache_key, body, BATCH_CACHE_TTL_SECONDS)
+
+    return _json_response(body)
@@ -7,18 +7,21 @@ IMPORTANT: This module ONLY creates NEW endpoints.
 It USES existing services (JobOrchestrator, Job model) - does NOT modify them.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, Optional, List
 from pydantic import BaseModel, Field
+from functools import lru_cache
+import asyncio
+import orjson
+import threading
+import uuid
 
 # Import database and models
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent.parent))
-
-from api.app.database import get_db
-from api.app.models.database import Job, User
+from ..database import get_async_db, in_values
+from ..core.cache import cache
+from ..models.database import Job
 
 # Import NEW export modules (no conflicts!)
 from src.export import GoogleAuthManager, GoogleSheetsExporter, GoogleDocsExporter
@@ -76,6 +79,182 @@ class ExportResponse(BaseModel):
     spreadsheet_url: Optional[str] = None
     document_url: Optional[str] = None
     jobs_exported: Optional[int] = None
+    task_id: Optional[str] = None
+
+
+class ExportStatusResponse(BaseModel):
+    """Response model for a queued export's state."""
+    task_id: str
+    status: str  # pending, done, failed
+    message: Optional[str] = None
+    spreadsheet_url: Optional[str] = None
+    document_url: Optional[str] = None
+    jobs_exported: Optional[int] = None
+
+
+# How long a queued export's result can be polled for. The status lives in
+# the shared cache, so exports are only queued when that is Redis.
+EXPORT_STATUS_TTL_SECONDS = 3600
+
+
+def _export_status_key(task_id: str) -> str:
+    return f"export:{task_id}"
+
+
+def _set_export_status(task_id: str, **fields) -> None:
+    cache.set(_export_status_key(task_id), orjson.dumps(fields), EXPORT_STATUS_TTL_SECONDS)
+
+
+# Job columns the Google exporters read; selected as plain rows so exports
+# skip ORM instances and the job_package/execution_log/metrics JSON
+_EXPORT_JOB_META_COLUMNS = (
+    Job.id,
+    Job.created_at,
+    Job.publisher_domain,
+    Job.target_url,
+    Job.anchor_text,
+    Job.status,
+    Job.qc_report,
+    Job.actual_cost,
+    Job.estimated_cost
+)
+_EXPORT_JOB_COLUMNS = _EXPORT_JOB_META_COLUMNS + (Job.article_text,)
+
+# Jobs whose article texts a batch export holds in memory at once
+EXPORT_ARTICLE_CHUNK_SIZE = 25
+
+# Max delivered jobs exported when a batch export names no job IDs
+EXPORT_BATCH_MAX_JOBS = 100
+
+
+def _job_export_data(row) -> Dict[str, Any]:
+    """Convert a row of _EXPORT_JOB_COLUMNS to the dict the exporters expect."""
+    job_data = dict(row._mapping)
+    estimated_cost = job_data.pop('estimated_cost')
+    job_data['actual_cost'] = job_data['actual_cost'] or estimated_cost
+    return job_data
+
+
+async def _query_specific(db: AsyncSession, job_ids: List[str]) -> list:
+    """
+    Fetch the named jobs for export.
+
+    Raises:
+        HTTPException: 404 listing the IDs that are missing or not delivered
+    """
+    jobs = (await db.execute(
+        select(*_EXPORT_JOB_META_COLUMNS).where(
+            in_values(db, Job.id, set(job_ids)),
+            Job.status == "delivered"
+        )
+    )).all()
+
+    missing = set(job_ids).difference(job.id for job in jobs)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Jobs not found or not delivered: {', '.join(sorted(missing))}"
+        )
+
+    return jobs
+
+
+async def _query_all_delivered(db: AsyncSession, limit: int) -> list:
+    """
+    Fetch up to limit delivered jobs for export.
+
+    Raises:
+        HTTPException: 404 if there are none
+    """
+    # For batch export, we'd ideally have a batch_id field on Job
+    # For now, this is a placeholder - adjust based on actual schema
+    jobs = (await db.execute(
+        select(*_EXPORT_JOB_META_COLUMNS).where(
+            Job.status == "delivered"
+        ).limit(limit)
+    )).all()
+
+    if not jobs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No deliverable jobs found for export"
+        )
+
+    return jobs
+
+
+async def _export_article_chunk(
+    db: AsyncSession,
+    chunk: List[Dict[str, Any]],
+    create_docs: bool,
+    folder_id: Optional[str]
+) -> Dict[str, str]:
+    """
+    Load the article texts of one chunk of a batch export.
+
+    Records each job's word count for the sheet and creates the chunk's
+    Google Docs (in folder_id, if given); the texts are released when this
+    returns.
+
+    Returns:
+        Mapping of job ID to document URL
+    """
+    texts = dict((await db.execute(
+        select(Job.id, Job.article_text).where(
+            in_values(db, Job.id, [job_data['id'] for job_data in chunk])
+        )
+    )).all())
+
+    for job_data in chunk:
+        text = texts.get(job_data['id'])
+        job_data['word_count'] = len(text.split()) if text else None
+
+    if not create_docs:
+        return {}
+
+    return await _call_google(
+        GoogleDocsExporter, 'export_jobs_to_docs_batch',
+        [
+            {**job_data, 'article_text': texts[job_data['id']]}
+            for job_data in chunk if texts.get(job_data['id'])
+        ],
+        folder_id=folder_id
+    )
+
+
+@lru_cache(maxsize=1)
+def get_auth_manager() -> GoogleAuthManager:
+    """Process-wide auth manager; credentials are loaded once and refreshed in place."""
+    return GoogleAuthManager()
+
+
+_thread_exporters = threading.local()
+
+
+def _thread_exporter(exporter_cls):
+    """
+    This thread's exporter of the given class.
+
+    API service objects are not thread-safe, so each worker thread keeps its
+    own exporters (and built services) on the shared auth manager.
+    """
+    exporters = _thread_exporters.__dict__.setdefault('exporters', {})
+    if exporter_cls not in exporters:
+        exporters[exporter_cls] = exporter_cls(get_auth_manager())
+    return exporters[exporter_cls]
+
+
+async def _call_google(exporter_cls, method: str, *args, **kwargs):
+    """
+    Run an exporter method in a worker thread.
+
+    Google API calls block on the network and on the shared rate limiter,
+    so they never run on the event loop.
+    """
+    def call():
+        return getattr(_thread_exporter(exporter_cls), method)(*args, **kwargs)
+
+    return await asyncio.to_thread(call)
 
 
 # Create router
@@ -86,21 +265,34 @@ router = APIRouter(
 )
 
 
-@router.post("/jobs/{job_id}/google-sheets", response_model=ExportResponse)
+@router.post(
+    "/jobs/{job_id}/google-sheets",
+    response_model=ExportResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
 async def export_job_to_google_sheets(
     job_id: str,
     request: ExportToGoogleSheetsRequest,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Export a single job to Google Sheets.
 
     Optionally creates a Google Doc with the full article and links it in the sheet.
 
+    With Redis, the Google API calls run after the response is sent (202);
+    poll GET /api/v1/export/status/{task_id} for the result. Without it the
+    status could only be read back from this process, so the export runs
+    within the request and its result is returned directly (200).
+
     Endpoint: POST /api/v1/export/jobs/{job_id}/google-sheets
     """
     # Fetch job from database (USES existing Job model - no modifications)
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = (await db.execute(
+        select(*_EXPORT_JOB_COLUMNS).where(Job.id == job_id)
+    )).first()
 
     if not job:
         raise HTTPException(
@@ -114,74 +306,134 @@ async def export_job_to_google_sheets(
             detail=f"Job must be in 'delivered' status (current: {job.status})"
         )
 
-    try:
-        # Initialize exporters (NEW code - no conflicts)
-        auth_manager = GoogleAuthManager()
-        sheets_exporter = GoogleSheetsExporter(auth_manager)
-        docs_exporter = GoogleDocsExporter(auth_manager)
+    if not cache.shared:
+        response.status_code = status.HTTP_200_OK
+        try:
+            return await _sheets_export(_job_export_data(job), request)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Export failed: {str(e)}"
+            )
 
-        # Convert job to dict
-        job_data = {
-            'id': job.id,
-            'created_at': job.created_at,
-            'publisher_domain': job.publisher_domain,
-            'target_url': job.target_url,
-            'anchor_text': job.anchor_text,
-            'status': job.status,
-            'article_text': job.article_text,
-            'qc_report': job.qc_report,
-            'actual_cost': job.actual_cost or job.estimated_cost
-        }
+    task_id = str(uuid.uuid4())
+    _set_export_status(task_id, status="pending")
+    background_tasks.add_task(
+        _run_sheets_export,
+        task_id,
+        _job_export_data(job),
+        request
+    )
 
-        # Create or use existing spreadsheet
-        if request.spreadsheet_id:
-            spreadsheet_id = request.spreadsheet_id
-            spreadsheet_url = sheets_exporter.get_spreadsheet_url(spreadsheet_id)
-        else:
-            # Create new spreadsheet
-            sheet_info = sheets_exporter.create_spreadsheet(
-                title=f"BACOWR Export - {job.publisher_domain}",
-                share_with_email=request.share_with_email
-            )
-            spreadsheet_id = sheet_info['spreadsheet_id']
-            spreadsheet_url = sheet_info['spreadsheet_url']
-
-        # Create Google Doc if requested
-        doc_url = None
-        if request.create_doc and job.article_text:
-            doc_info = docs_exporter.export_job_to_doc(
-                job_data,
-                share_with_email=request.share_with_email
-            )
-            doc_url = doc_info['document_url']
+    return ExportResponse(
+        success=True,
+        message=f"Export of job {job_id} to Google Sheets queued",
+        task_id=task_id
+    )
+
+
+async def _no_result() -> None:
+    return None
+
+
+async def _sheets_export(
+    job_data: Dict[str, Any],
+    request: ExportToGoogleSheetsRequest
+) -> ExportResponse:
+    """
+    Google API part of export_job_to_google_sheets.
 
-        # Export to sheet
-        sheets_exporter.export_job(
-            spreadsheet_id=spreadsheet_id,
-            job_data=job_data,
-            doc_url=doc_url
+    Creating the spreadsheet and the Google Doc are independent, so they
+    run concurrently; only the row write needs both.
+    """
+    # Create new spreadsheet unless an existing one is given
+    if request.spreadsheet_id:
+        create_sheet = _no_result()
+    else:
+        create_sheet = _call_google(
+            GoogleSheetsExporter, 'create_spreadsheet',
+            title=f"BACOWR Export - {job_data['publisher_domain']}",
+            share_with_email=request.share_with_email
         )
 
-        return ExportResponse(
-            success=True,
-            message=f"Job {job_id} exported to Google Sheets successfully",
-            spreadsheet_url=spreadsheet_url,
-            document_url=doc_url,
-            jobs_exported=1
+    # Create Google Doc if requested
+    if request.create_doc and job_data['article_text']:
+        create_doc = _call_google(
+            GoogleDocsExporter, 'export_job_to_doc',
+            job_data,
+            share_with_email=request.share_with_email
+        )
+    else:
+        create_doc = _no_result()
+
+    sheet_info, doc_info = await asyncio.gather(create_sheet, create_doc)
+
+    if sheet_info:
+        spreadsheet_id = sheet_info['spreadsheet_id']
+        spreadsheet_url = sheet_info['spreadsheet_url']
+    else:
+        spreadsheet_id = request.spreadsheet_id
+        spreadsheet_url = GoogleSheetsExporter.get_spreadsheet_url(spreadsheet_id)
+
+    doc_url = doc_info['document_url'] if doc_info else None
+
+    # Export to sheet
+    await _call_google(
+        GoogleSheetsExporter, 'export_job',
+        spreadsheet_id=spreadsheet_id,
+        job_data=job_data,
+        doc_url=doc_url
+    )
+
+    return ExportResponse(
+        success=True,
+        message=f"Job {job_data['id']} exported to Google Sheets successfully",
+        spreadsheet_url=spreadsheet_url,
+        document_url=doc_url,
+        jobs_exported=1
+    )
+
+
+async def _run_sheets_export(
+    task_id: str,
+    job_data: Dict[str, Any],
+    request: ExportToGoogleSheetsRequest
+) -> None:
+    """Background part of export_job_to_google_sheets; records the result for polling."""
+    try:
+        result = await _sheets_export(job_data, request)
+        _set_export_status(
+            task_id,
+            status="done",
+            **result.model_dump(include={"message", "spreadsheet_url", "document_url", "jobs_exported"})
         )
 
     except Exception as e:
+        _set_export_status(task_id, status="failed", message=f"Export failed: {str(e)}")
+
+
+@router.get("/status/{task_id}", response_model=ExportStatusResponse)
+async def get_export_status(task_id: str):
+    """
+    Get the state of a queued export.
+
+    Endpoint: GET /api/v1/export/status/{task_id}
+    """
+    cached = cache.get(_export_status_key(task_id))
+    if cached is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Export failed: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export task {task_id} not found"
         )
 
+    return ExportStatusResponse(task_id=task_id, **orjson.loads(cached))
+
 
 @router.post("/jobs/{job_id}/google-docs", response_model=ExportResponse)
 async def export_job_to_google_docs(
     job_id: str,
     request: ExportToGoogleDocsRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Export a single job to Google Docs only.
@@ -189,7 +441,9 @@ async def export_job_to_google_docs(
     Endpoint: POST /api/v1/export/jobs/{job_id}/google-docs
     """
     # Fetch job from database
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = (await db.execute(
+        select(*_EXPORT_JOB_COLUMNS).where(Job.id == job_id)
+    )).first()
 
     if not job:
         raise HTTPException(
@@ -204,23 +458,12 @@ async def export_job_to_google_docs(
         )
 
     try:
-        # Initialize exporter
-        docs_exporter = GoogleDocsExporter()
-
         # Convert job to dict
-        job_data = {
-            'id': job.id,
-            'created_at': job.created_at,
-            'publisher_domain': job.publisher_domain,
-            'target_url': job.target_url,
-            'anchor_text': job.anchor_text,
-            'status': job.status,
-            'article_text': job.article_text,
-            'qc_report': job.qc_report
-        }
+        job_data = _job_export_data(job)
 
         # Create Google Doc
-        doc_info = docs_exporter.export_job_to_doc(
+        doc_info = await _call_google(
+            GoogleDocsExporter, 'export_job_to_doc',
             job_data,
             share_with_email=request.share_with_email
         )
@@ -243,7 +486,7 @@ async def export_job_to_google_docs(
 async def export_batch_to_google_sheets(
     batch_id: str,
     request: BatchExportToGoogleRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Export a batch of jobs to Google Sheets.
@@ -264,62 +507,39 @@ async def export_batch_to_google_sheets(
 
     # Determine which jobs to export
     if request.job_ids:
-        # Export specific jobs
-        jobs = db.query(Job).filter(
-            Job.id.in_(request.job_ids),
-            Job.status == "delivered"
-        ).all()
+        jobs = await _query_specific(db, request.job_ids)
     else:
-        # For batch export, we'd ideally have a batch_id field on Job
-        # For now, this is a placeholder - adjust based on actual schema
-        jobs = db.query(Job).filter(
-            Job.status == "delivered"
-        ).limit(100).all()  # Limit for safety
-
-    if not jobs:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No deliverable jobs found for export"
-        )
+        jobs = await _query_all_delivered(db, EXPORT_BATCH_MAX_JOBS)
 
     try:
-        # Initialize exporters
-        auth_manager = GoogleAuthManager()
-        sheets_exporter = GoogleSheetsExporter(auth_manager)
-        docs_exporter = GoogleDocsExporter(auth_manager)
-
-        # Convert jobs to dict format
-        job_data_list = []
-        for job in jobs:
-            job_data_list.append({
-                'id': job.id,
-                'created_at': job.created_at,
-                'publisher_domain': job.publisher_domain,
-                'target_url': job.target_url,
-                'anchor_text': job.anchor_text,
-                'status': job.status,
-                'article_text': job.article_text,
-                'qc_report': job.qc_report,
-                'actual_cost': job.actual_cost or job.estimated_cost
-            })
-
-        # Create Google Docs if requested
+        # Convert jobs to dict format (article texts are not loaded here)
+        job_data_list = list(map(_job_export_data, jobs))
+        batch_name = request.batch_name or batch_id
+
+        # Docs go into one folder that is shared once, instead of sharing
+        # every Doc with its own Drive request
+        folder_id = None
+        if request.create_docs and request.share_with_email:
+            folder_id = await _call_google(
+                GoogleDocsExporter, 'create_shared_folder',
+                f"BACOWR Batch: {batch_name}",
+                request.share_with_email
+            )
+
+        # Load article texts a chunk at a time for word counts and, if
+        # requested, Google Docs, so memory does not grow with batch size
         doc_urls = {}
-        if request.create_docs:
-            for job_data in job_data_list:
-                if job_data.get('article_text'):
-                    try:
-                        doc_info = docs_exporter.export_job_to_doc(
-                            job_data,
-                            share_with_email=request.share_with_email
-                        )
-                        doc_urls[job_data['id']] = doc_info['document_url']
-                    except Exception as e:
-                        print(f"Warning: Failed to create doc for {job_data['id']}: {e}")
+        for start in range(0, len(job_data_list), EXPORT_ARTICLE_CHUNK_SIZE):
+            doc_urls.update(await _export_article_chunk(
+                db,
+                job_data_list[start:start + EXPORT_ARTICLE_CHUNK_SIZE],
+                request.create_docs,
+                folder_id
+            ))
 
         # Export batch to Google Sheets
-        batch_name = request.batch_name or batch_id
-        export_result = sheets_exporter.export_batch(
+        export_result = await _call_google(
+            GoogleSheetsExporter, 'export_batch',
             batch_jobs=job_data_list,
             batch_name=batch_name,
             doc_urls=doc_urls,
@@ -341,7 +561,9 @@ async def export_batch_to_google_sheets(
 
 
 @router.get("/google/auth/status")
-async def get_google_auth_status():
+async def get_google_auth_status(
+    auth_manager: GoogleAuthManager = Depends(get_auth_manager)
+):
     """
     Check Google authentication status.
 
@@ -350,8 +572,6 @@ async def get_google_auth_status():
     Endpoint: GET /api/v1/export/google/auth/status
     """
     try:
-        auth_manager = GoogleAuthManager()
-
         # Validate credentials file
         validation = GoogleAuthManager.validate_credentials_file(
             auth_manager.credentials_path
@@ -2,100 +2,215 @@
 Job routes for creating and managing content generation jobs.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status, BackgroundTasks
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
-
-from ..database import get_db
-from ..models.database import User, Job, JobResult
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from functools import lru_cache
+import orjson
+import os
+
+from ..database import get_db, AsyncSessionLocal
+from ..models.database import User, Job, JobResult, qc_summary
 from ..models.schemas import (
     JobCreate, JobResponse, JobDetailResponse,
     PaginationParams, PaginatedResponse, JobStatus
 )
 from ..services.auth_service import get_current_user_jwt
 from ..core.bacowr_wrapper import bacowr
+from ..core.cache import cache, invalidate_job_counts, job_counts_key
+from ..core.job_queue import job_queue
+from ..core.pagination import decode_cursor, encode_cursor, keyset_before
+from ..middleware.prometheus import track_cache_lookup
+from .websocket import send_job_progress
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# Articles never change once generated (regeneration creates a new job);
+# the TTL only bounds cache memory. Deleting the job drops the entry.
+ARTICLE_CACHE_TTL_SECONDS = int(os.getenv("ARTICLE_CACHE_TTL_SECONDS", "86400"))
 
-async def run_job_background(
-    job_id: str,
-    job_create: JobCreate,
-    db: Session
-):
-    """Background task to run BACOWR job."""
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        return
 
-    try:
-        # Update status to processing
-        job.status = JobStatus.PROCESSING
-        job.started_at = datetime.utcnow()
-        db.commit()
+def _article_cache_key(user_id: str, job_id: str) -> str:
+    return f"job:{user_id}:{job_id}:article"
 
-        # Run BACOWR
-        result = await bacowr.run_job(
-            publisher_domain=job_create.publisher_domain,
-            target_url=job_create.target_url,
-            anchor_text=job_create.anchor_text,
-            llm_provider=job_create.llm_provider if job_create.llm_provider != "auto" else None,
-            writing_strategy=job_create.writing_strategy,
-            use_ahrefs=job_create.use_ahrefs,
-            country=job_create.country,
-            enable_llm_profiling=job_create.enable_llm_profiling
-        )
 
-        # Update job with results
-        job.status = result['status']
-        job.article_text = result.get('article')
-        job.job_package = result.get('job_package')
-        job.qc_report = result.get('qc_report')
-        job.execution_log = result.get('execution_log')
-        job.metrics = result.get('metrics')
-        job.completed_at = datetime.utcnow()
-
-        # Calculate actual cost (estimate for now)
-        if job.metrics and 'generation' in job.metrics:
-            provider = job.metrics['generation'].get('provider', 'anthropic')
-            strategy = job.metrics['generation'].get('strategy', 'multi_stage')
-            cost_estimate = bacowr.estimate_cost(provider, strategy, 1)
-            job.actual_cost = cost_estimate['estimated_cost_per_job']
+# Statuses list_jobs(active=true) returns
+ACTIVE_JOB_STATUSES = (JobStatus.PENDING, JobStatus.PROCESSING)
 
-        db.commit()
+# Per-status job counts behind list_jobs' total. Job writes drop the entry;
+# the TTL bounds staleness when API workers each hold an in-process cache.
+JOB_COUNTS_TTL_SECONDS = int(os.getenv("JOB_COUNTS_TTL_SECONDS", "60"))
 
-        # Create analytics record
-        if result.get('qc_report'):
-            qc_report = result['qc_report']
-            job_result = JobResult(
-                job_id=job.id,
-                user_id=job.user_id,
-                qc_score=0,  # Calculate from qc_report
-                qc_status=qc_report.get('status'),
-                issue_count=len(qc_report.get('issues', [])),
-                generation_time_seconds=job.metrics.get('generation', {}).get('duration_seconds') if job.metrics else None,
-                total_time_seconds=(job.completed_at - job.started_at).total_seconds() if job.completed_at and job.started_at else None,
-                provider_used=job.metrics.get('generation', {}).get('provider') if job.metrics else None,
-                model_used=job.metrics.get('generation', {}).get('model') if job.metrics else None,
-                strategy_used=job.writing_strategy,
-                cost_actual=job.actual_cost,
-                delivered=job.status == JobStatus.DELIVERED
-            )
-            db.add(job_result)
-            db.commit()
 
-    except Exception as e:
-        job.status = JobStatus.ABORTED
-        job.error_message = str(e)
-        job.completed_at = datetime.utcnow()
-        db.commit()
+def _job_counts(db: Session, user_id: str) -> Dict[str, int]:
+    """Return the user's job count per status (one GROUP BY on a miss)."""
+    cache_key = job_counts_key(user_id)
+    cached = cache.get(cache_key)
+    track_cache_lookup("job_counts", cached is not None)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    counts = dict(db.execute(
+        select(Job.status, func.count()).where(Job.user_id == user_id).group_by(Job.status)
+    ).all())
+    cache.set(cache_key, orjson.dumps(counts), JOB_COUNTS_TTL_SECONDS)
+    return counts
+
+# How long a create_job Idempotency-Key maps to its job
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
 
 
+def _idempotent_job(db: Session, user_id: str, key: str) -> Optional[Job]:
+    """Return the job created with this Idempotency-Key, if still live."""
+    # Expired keys are released so the client may reuse them
+    cutoff = datetime.utcnow() - timedelta(seconds=IDEMPOTENCY_KEY_TTL_SECONDS)
+    db.execute(
+        update(Job).where(
+            Job.user_id == user_id,
+            Job.idempotency_key == key,
+            Job.created_at < cutoff
+        ).values(idempotency_key=None)
+    )
+
+    return db.scalars(
+        select(Job).where(Job.user_id == user_id, Job.idempotency_key == key)
+    ).first()
+
+
+# The job list reads only JobResponse's columns (not the article or JSON
+# payloads) and validates a whole page in one pydantic-core call
+_JOB_LIST_COLUMNS = tuple(getattr(Job, name) for name in JobResponse.model_fields)
+_JOB_LIST = TypeAdapter(List[JobResponse])
+
+
+@lru_cache(maxsize=64)
+def _cost_per_job(provider: str, strategy: str) -> float:
+    """Per-job cost estimate; fixed per (provider, strategy), so cached."""
+    return bacowr.estimate_cost(provider, strategy, 1)['estimated_cost_per_job']
+
+
+async def run_job_background(
+    job_id: str,
+    job_create: JobCreate
+):
+    """
+    Background task to run BACOWR job.
+
+    Opens its own session: the request's session is closed by the time
+    this runs (or, with the job queue, lives in another process). The
+    session is async so the status writes never block the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        started_at = datetime.utcnow()
+
+        # Claim the job and read back what the analytics record needs in
+        # one statement (its own commit so pollers see it). Only a pending
+        # job matches, so a job handed out twice - redelivered, or picked up
+        # by two workers - still runs once.
+        job = (await db.execute(
+            update(Job).where(
+                Job.id == job_id,
+                Job.status == JobStatus.PENDING
+            ).values(
+                status=JobStatus.PROCESSING,
+                started_at=started_at
+            ).returning(Job.user_id, Job.writing_strategy)
+        )).first()
+        if not job:
+            return
+        await db.commit()
+        invalidate_job_counts(job.user_id)
+
+        user_id = job.user_id
+        writing_strategy = job.writing_strategy
+
+        try:
+            await send_job_progress(job_id, JobStatus.PROCESSING, 0, "Job started")
+
+            async def report_progress(progress: float, message: str):
+                await send_job_progress(job_id, JobStatus.PROCESSING, progress, message)
+
+            # Run BACOWR
+            result = await bacowr.run_job(
+                publisher_domain=job_create.publisher_domain,
+                target_url=job_create.target_url,
+                anchor_text=job_create.anchor_text,
+                llm_provider=job_create.llm_provider if job_create.llm_provider != "auto" else None,
+                writing_strategy=job_create.writing_strategy,
+                use_ahrefs=job_create.use_ahrefs,
+                country=job_create.country,
+                enable_llm_profiling=job_create.enable_llm_profiling,
+                progress_callback=report_progress
+            )
+
+            metrics = result.get('metrics')
+            qc_report = result.get('qc_report')
+            generation = metrics.get('generation', {}) if metrics else {}
+
+            # Update job with results
+            job_values = {
+                'status': result['status'],
+                'article_text': result.get('article'),
+                'job_package': result.get('job_package'),
+                'qc_report': qc_report,
+                'execution_log': result.get('execution_log'),
+                'metrics': metrics,
+                'completed_at': datetime.utcnow(),
+                **qc_summary(qc_report)
+            }
+
+            # Calculate actual cost (estimate for now)
+            if generation:
+                provider = generation.get('provider', 'anthropic')
+                strategy = generation.get('strategy', 'multi_stage')
+                job_values['actual_cost'] = _cost_per_job(provider, strategy)
+
+            # Results and the analytics record are written as plain
+            # UPDATE/INSERT statements in one transaction
+            await db.execute(update(Job).where(Job.id == job_id).values(**job_values))
+
+            # Create analytics record
+            if qc_report:
+                await db.execute(insert(JobResult).values(
+                    job_id=job_id,
+                    user_id=user_id,
+                    qc_score=job_values['qc_score'],
+                    qc_status=job_values['qc_status'],
+                    issue_count=job_values['qc_issues_count'],
+                    generation_time_seconds=generation.get('duration_seconds'),
+                    total_time_seconds=(job_values['completed_at'] - started_at).total_seconds(),
+                    provider_used=generation.get('provider'),
+                    model_used=generation.get('model'),
+                    strategy_used=writing_strategy,
+                    cost_actual=job_values.get('actual_cost'),
+                    delivered=job_values['status'] == JobStatus.DELIVERED
+                ))
+
+            await db.commit()
+            invalidate_job_counts(user_id)
+            await send_job_progress(job_id, job_values['status'], 100, "Job finished")
+
+        except Exception as e:
+            await db.rollback()
+            await db.execute(update(Job).where(Job.id == job_id).values(
+                status=JobStatus.ABORTED,
+                error_message=str(e),
+                completed_at=datetime.utcnow()
+            ))
+            await db.commit()
+            invalidate_job_counts(user_id)
+            await send_job_progress(job_id, JobStatus.ABORTED, 100, f"Error: {e}")
+
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     job_create: JobCreate,
     background_tasks: BackgroundTasks,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user_jwt)
 ):
@@ -104,10 +219,20 @@ async def create_job(
 
     The job will be processed asynchronously in the background.
     Use GET /jobs/{job_id} to check status and retrieve results.
+
+    Send an Idempotency-Key header to retry safely: a repeat request with
+    the same key within 24 hours returns the existing job (200) instead of
+    starting another run.
     """
+    if idempotency_key:
+        existing = _idempotent_job(db, current_user.id, idempotency_key)
+        if existing is not None:
+            response.status_code = status.HTTP_200_OK
+            return existing
+
     # Estimate cost
     provider = job_create.llm_provider if job_create.llm_provider != "auto" else "anthropic"
-    cost_estimate = bacowr.estimate_cost(provider, job_create.writing_strategy, 1)
+    estimated_cost = _cost_per_job(provider, job_create.writing_strategy)
 
     # Create job record
     job = Job(
@@ -121,51 +246,107 @@ async def create_job(
         use_ahrefs=job_create.use_ahrefs,
         enable_llm_profiling=job_create.enable_llm_profiling,
         status=JobStatus.PENDING,
-        estimated_cost=cost_estimate['estimated_cost_per_job']
+        estimated_cost=estimated_cost,
+        idempotency_key=idempotency_key or None
     )
 
     db.add(job)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request with the same key won the insert
+        db.rollback()
+        existing = _idempotent_job(db, current_user.id, idempotency_key) if idempotency_key else None
+        if existing is None:
+            raise
+        response.status_code = status.HTTP_200_OK
+        return existing
     db.refresh(job)
+    invalidate_job_counts(current_user.id)
 
-    # Schedule background task
-    background_tasks.add_task(run_job_background, job.id, job_create, db)
+    # Hand the job to the worker queue; run it in-process without one
+    if not await job_queue.enqueue(job.id, job_create.model_dump(mode="json")):
+        background_tasks.add_task(run_job_background, job.id, job_create)
 
     return job
 
 
 @router.get("", response_model=PaginatedResponse)
 def list_jobs(
-    page: int = 1,
-    page_size: int = 20,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
     status: Optional[JobStatus] = None,
+    active: bool = False,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user_jwt)
 ):
     """
     List jobs for current user with pagination.
 
-    Optional filtering by status.
+    Optional filtering by status, or active=true for the jobs still in
+    flight (pending and processing) as shown on the dashboard.
+
+    Pagination:
+    - page/page_size: Offset pagination
+    - cursor: Pass the previous response's next_cursor instead of page to
+      read the next page by key (constant cost for deep pages)
     """
-    query = db.query(Job).filter(Job.user_id == current_user.id)
+    filters = [Job.user_id == current_user.id]
 
     if status:
-        query = query.filter(Job.status == status)
+        filters.append(Job.status == status)
+    elif active:
+        filters.append(Job.status.in_(ACTIVE_JOB_STATUSES))
+
+    # page_size + 1 rows: the extra one tells whether there is a next page
+    query = select(*_JOB_LIST_COLUMNS).where(*filters).order_by(
+        Job.created_at.desc(),
+        Job.id.desc()
+    ).limit(page_size + 1)
+
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            # `status` is the filter parameter here, not fastapi.status
+            raise HTTPException(status_code=400, detail=str(e))
+
+        query = query.where(
+            keyset_before(
+                db.bind.dialect.name,
+                Job.created_at, Job.id,
+                cursor_created_at, cursor_id
+            )
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    rows = db.execute(query).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
 
-    # Count total
-    total = query.count()
+    # The total comes from the cached per-status counts rather than a
+    # COUNT over every matching row on each page request
+    counts = _job_counts(db, current_user.id)
+    if status:
+        total = counts.get(status.value, 0)
+    elif active:
+        total = sum(counts.get(s.value, 0) for s in ACTIVE_JOB_STATUSES)
+    else:
+        total = sum(counts.values())
 
-    # Paginate
-    jobs = query.order_by(Job.created_at.desc())\
-        .offset((page - 1) * page_size)\
-        .limit(page_size)\
-        .all()
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
 
     return PaginatedResponse.create(
-        items=[JobResponse.model_validate(job) for job in jobs],
+        items=_JOB_LIST.validate_python(rows, from_attributes=True),
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -205,25 +386,37 @@ def delete_job(
 
     Only pending or completed jobs can be deleted.
     """
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.user_id == current_user.id
-    ).first()
+    # Only the status is needed; the article and JSON columns stay unread
+    job_status = db.execute(
+        select(Job.status).where(
+            Job.id == job_id,
+            Job.user_id == current_user.id
+        )
+    ).scalar_one_or_none()
 
-    if not job:
+    if job_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
 
-    if job.status == JobStatus.PROCESSING:
+    if job_status == JobStatus.PROCESSING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete job that is currently processing"
         )
 
-    db.delete(job)
+    db.execute(
+        delete(Job).where(
+            Job.id == job_id,
+            Job.user_id == current_user.id,
+            # Guards against the job being picked up since the check
+            Job.status != JobStatus.PROCESSING
+        )
+    )
     db.commit()
+    cache.delete(_article_cache_key(current_user.id, job_id))
+    invalidate_job_counts(current_user.id)
 
     return None
 
@@ -239,9 +432,18 @@ def get_job_article(
 
     Returns plain text Markdown article.
     """
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.user_id == current_user.id
+    cache_key = _article_cache_key(current_user.id, job_id)
+    cached = cache.get(cache_key)
+    track_cache_lookup("get_job_article", cached is not None)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Select just the returned columns rather than the whole row
+    job = db.execute(
+        select(Job.id, Job.article_text, Job.completed_at).where(
+            Job.id == job_id,
+            Job.user_id == current_user.id
+        )
     ).first()
 
     if not job:
@@ -256,8 +458,11 @@ def get_job_article(
             detail="Article not yet generated"
         )
 
-    return {
+    body = orjson.dumps({
         "job_id": job.id,
         "article": job.article_text,
         "created_at": job.completed_at
-    }
+    })
+    cache.set(cache_key, body, ARTICLE_CACHE_TTL_SECONDS)
+
+    return Response(content=body, media_type="application/json")
@@ -5,10 +5,13 @@ Provides admin endpoints for managing users, roles, and quotas.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from ..database import get_db
+from ..auth import invalidate_user_cache
+from ..database import get_db, get_async_db
 from ..models.database import User
 from ..models.schemas import (
     UserResponse,
@@ -16,7 +19,7 @@ from ..models.schemas import (
     UserListResponse,
     QuotaStatus,
 )
-from ..services.auth_service import require_admin, get_current_user_jwt
+from ..services.auth_service import AuthService, require_admin, get_current_user_jwt
 
 router = APIRouter(prefix="/users", tags=["user-management"])
 
@@ -28,7 +31,7 @@ async def list_users(
     role: Optional[str] = Query(None, description="Filter by role"),
     status: Optional[str] = Query(None, description="Filter by account status"),
     search: Optional[str] = Query(None, description="Search by email or username"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List all users (admin only).
@@ -44,29 +47,33 @@ async def list_users(
 
     Requires: Admin role
     """
-    query = db.query(User)
+    query = select(User)
 
     # Apply filters
     if role:
-        query = query.filter(User.role == role)
+        query = query.where(User.role == role)
 
     if status:
-        query = query.filter(User.account_status == status)
+        query = query.where(User.account_status == status)
 
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             (User.email.ilike(search_term)) |
             (User.username.ilike(search_term)) |
             (User.full_name.ilike(search_term))
         )
 
     # Get total count
-    total = query.count()
+    total = (await db.execute(
+        select(func.count()).select_from(query.subquery())
+    )).scalar_one()
 
     # Paginate
     offset = (page - 1) * page_size
-    users = query.offset(offset).limit(page_size).all()
+    users = (await db.execute(
+        query.offset(offset).limit(page_size)
+    )).scalars().all()
 
     return UserListResponse(
         users=[UserResponse.model_validate(user) for user in users],
@@ -91,7 +98,7 @@ async def get_user(
 
     Requires: Admin role
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -126,7 +133,7 @@ async def update_user(
 
     Requires: Admin role
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -169,6 +176,7 @@ async def update_user(
 
     db.commit()
     db.refresh(user)
+    invalidate_user_cache(user_id)
 
     return UserResponse.model_validate(user)
 
@@ -192,7 +200,7 @@ async def delete_user(
 
     Requires: Admin role
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -202,14 +210,14 @@ async def delete_user(
 
     if hard_delete:
         # Permanently delete
-        db.delete(user)
-        db.commit()
+        AuthService.delete_user(user_id, db)
         return {"message": "User permanently deleted", "user_id": user_id}
     else:
         # Soft delete
         user.account_status = "deleted"
         user.is_active = False
         db.commit()
+        invalidate_user_cache(user_id)
         return {"message": "User marked as deleted", "user_id": user_id}
 
 
@@ -254,7 +262,7 @@ async def reset_user_quota(
 
     Requires: Admin role
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -265,6 +273,7 @@ async def reset_user_quota(
     user.jobs_created_count = 0
     user.tokens_used = 0
     db.commit()
+    invalidate_user_cache(user_id)
 
     return {
         "message": "User quota reset successfully",
@@ -289,7 +298,7 @@ async def suspend_user(
 
     Requires: Admin role
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -300,6 +309,7 @@ async def suspend_user(
     user.account_status = "suspended"
     user.is_active = False
     db.commit()
+    invalidate_user_cache(user_id)
 
     return {
         "message": "User suspended successfully",
@@ -322,7 +332,7 @@ async def activate_user(
 
     Requires: Admin role
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -333,6 +343,7 @@ async def activate_user(
     user.account_status = "active"
     user.is_active = True
     db.commit()
+    invalidate_user_cache(user_id)
 
     return {
         "message": "User activated successfully",
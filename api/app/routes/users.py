@@ -2,18 +2,45 @@
 User management routes (Admin only).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 
-from ..database import get_db
+from ..database import get_db, get_async_db, SessionLocal
 from ..models.database import User
 from ..models.schemas import UserCreate, UserResponse
-from ..auth import get_current_admin_user, generate_api_key, hash_password
+from ..auth import (
+    get_current_admin_user,
+    generate_api_key,
+    hash_password,
+    invalidate_user_cache,
+)
+from ..services.audit_service import write_audit_log
+from ..services.auth_service import AuthService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
+def _audit_user_change(
+    background_tasks: BackgroundTasks,
+    action: str,
+    user_id: str,
+    admin: User
+) -> None:
+    """Record an admin change to a user once the response has been sent."""
+    background_tasks.add_task(
+        write_audit_log,
+        SessionLocal,
+        action=action,
+        resource_type="user",
+        resource_id=user_id,
+        user_id=admin.id,
+        user_email=admin.email
+    )
+
+
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def create_user(
     user_create: UserCreate,
@@ -53,16 +80,18 @@ def create_user(
 
 
 @router.get("", response_model=List[UserResponse])
-def list_users(
+async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     admin: User = Depends(get_current_admin_user)
 ):
     """
     List all users (Admin only).
     """
-    users = db.query(User).offset(skip).limit(limit).all()
+    users = (await db.execute(
+        select(User).offset(skip).limit(limit)
+    )).scalars().all()
     return [UserResponse.model_validate(u) for u in users]
 
 
@@ -86,7 +115,7 @@ def get_user(
     """
     Get user by ID (Admin only).
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -100,13 +129,14 @@ def get_user(
 @router.patch("/{user_id}/activate", response_model=UserResponse)
 def activate_user(
     user_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin: User = Depends(get_current_admin_user)
 ):
     """
     Activate a user (Admin only).
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -117,6 +147,8 @@ def activate_user(
     user.is_active = True
     db.commit()
     db.refresh(user)
+    invalidate_user_cache(user_id)
+    _audit_user_change(background_tasks, "user.activate", user_id, admin)
 
     return UserResponse.model_validate(user)
 
@@ -124,6 +156,7 @@ def activate_user(
 @router.patch("/{user_id}/deactivate", response_model=UserResponse)
 def deactivate_user(
     user_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin: User = Depends(get_current_admin_user)
 ):
@@ -132,7 +165,7 @@ def deactivate_user(
 
     Deactivated users cannot access the API.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -149,6 +182,8 @@ def deactivate_user(
     user.is_active = False
     db.commit()
     db.refresh(user)
+    invalidate_user_cache(user_id)
+    _audit_user_change(background_tasks, "user.deactivate", user_id, admin)
 
     return UserResponse.model_validate(user)
 
@@ -156,6 +191,7 @@ def deactivate_user(
 @router.post("/{user_id}/regenerate-api-key", response_model=UserResponse)
 def regenerate_api_key(
     user_id: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin: User = Depends(get_current_admin_user)
 ):
@@ -164,7 +200,7 @@ def regenerate_api_key(
 
     Warning: This will invalidate the old API key.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -175,6 +211,8 @@ def regenerate_api_key(
     user.api_key = generate_api_key()
     db.commit()
     db.refresh(user)
+    invalidate_user_cache(user_id)
+    _audit_user_change(background_tasks, "user.regenerate_api_key", user_id, admin)
 
     return UserResponse.model_validate(user)
 
@@ -190,7 +228,7 @@ def delete_user(
 
     This will cascade delete all jobs and backlinks associated with the user.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -204,7 +242,6 @@ def delete_user(
             detail="Cannot delete your own account"
         )
 
-    db.delete(user)
-    db.commit()
+    AuthService.delete_user(user_id, db)
 
     return None
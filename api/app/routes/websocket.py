@@ -3,13 +3,16 @@ WebSocket route for real-time job progress updates.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Dict, Set
+import asyncio
 import json
 import logging
 from datetime import datetime
 
 from ..database import get_db
+from ..core.job_events import job_events
 from ..models.database import Job
 from ..auth import api_key_header
 
@@ -141,20 +144,22 @@ async def websocket_job_progress(
         return
 
     # Verify API key and get user
-    from ..models.database import User
-    user = db.query(User).filter(User.api_key == api_key).first()
+    from ..models.database import User, hash_api_key
+    user = db.query(User).filter(User.api_key_hash == hash_api_key(api_key)).first()
 
     if not user or not user.is_active:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid API key")
         return
 
-    # Verify job belongs to user
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.user_id == user.id
-    ).first()
+    # Verify job belongs to user (only the status is needed, not the payloads)
+    job_status = db.scalar(
+        select(Job.status).where(
+            Job.id == job_id,
+            Job.user_id == user.id
+        )
+    )
 
-    if not job:
+    if job_status is None:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Job not found")
         return
 
@@ -162,34 +167,48 @@ async def websocket_job_progress(
     await manager.connect(websocket, job_id, user.id)
 
     try:
-        # Send initial status
-        await websocket.send_json({
-            "job_id": job_id,
-            "status": job.status,
-            "progress": 0 if job.status == "pending" else (100 if job.status in ["delivered", "blocked", "aborted"] else 50),
-            "message": f"Connected. Current status: {job.status}",
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        async with job_events.subscribe(job_id) as events:
+            # Read the status again now that no later transition can be missed
+            job_status = db.scalar(select(Job.status).where(Job.id == job_id)) or job_status
+
+            # Send initial status
+            await websocket.send_json({
+                "job_id": job_id,
+                "status": job_status,
+                "progress": 0 if job_status == "pending" else (100 if job_status in ["delivered", "blocked", "aborted"] else 50),
+                "message": f"Connected. Current status: {job_status}",
+                "timestamp": datetime.utcnow().isoformat()
+            })
+
+            # Push progress events published by the job (in this process or a worker)
+            async def forward_events():
+                async for event in events:
+                    await websocket.send_json(event)
+
+            forwarder = asyncio.create_task(forward_events())
 
-        # Keep connection alive and listen for client messages
-        while True:
             try:
-                # Wait for client messages (ping/pong)
-                data = await websocket.receive_text()
-
-                # Handle ping
-                if data == "ping":
-                    await websocket.send_text("pong")
-
-                # Optionally handle other client messages
-                # (For now, we just keep the connection alive)
-
-            except WebSocketDisconnect:
-                logger.info(f"Client disconnected from job {job_id}")
-                break
-            except Exception as e:
-                logger.error(f"Error in websocket loop: {e}")
-                break
+                # Keep connection alive and listen for client messages
+                while True:
+                    try:
+                        # Wait for client messages (ping/pong)
+                        data = await websocket.receive_text()
+
+                        # Handle ping
+                        if data == "ping":
+                            await websocket.send_text("pong")
+
+                        # Optionally handle other client messages
+                        # (For now, we just keep the connection alive)
+
+                    except WebSocketDisconnect:
+                        logger.info(f"Client disconnected from job {job_id}")
+                        break
+                    except Exception as e:
+                        logger.error(f"Error in websocket loop: {e}")
+                        break
+            finally:
+                forwarder.cancel()
 
     finally:
         manager.disconnect(websocket, job_id)
@@ -205,7 +224,9 @@ async def send_job_progress(
     """
     Helper function to send progress updates from anywhere in the application.
 
-    This can be called from the job processing background task.
+    This can be called from the job processing background task, including
+    in the worker process: updates are published through core.job_events
+    and pushed by whichever API process holds the client's WebSocket.
 
     Args:
         job_id: Job ID
@@ -213,4 +234,10 @@ async def send_job_progress(
         progress: Progress percentage (0-100)
         message: Progress message
     """
-    await manager.send_progress_update(job_id, status, progress, message)
+    await job_events.publish(job_id, {
+        "job_id": job_id,
+        "status": status,
+        "progress": progress,
+        "message": message,
+        "timestamp": datetime.utcnow().isoformat()
+    })
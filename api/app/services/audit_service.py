@@ -6,10 +6,15 @@ Provides high-level API for logging user actions and system events.
 
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from ..models.audit import AuditLog
 from fastapi import Request
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+_HOUR = timedelta(hours=1)
 
 
 class AuditService:
@@ -38,6 +43,9 @@ class AuditService:
         "user.create": "User created",
         "user.update": "User updated",
         "user.delete": "User deleted",
+        "user.activate": "User activated",
+        "user.deactivate": "User deactivated",
+        "user.regenerate_api_key": "User API key regenerated",
 
         # Backlink actions
         "backlink.create": "Backlink created",
@@ -284,16 +292,11 @@ class AuditService:
         Returns:
             List of security event audit logs
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        security_actions = [
-            "auth.failed",
-            "auth.rate_limited",
-            "auth.invalid_key"
-        ]
+        since = datetime.utcnow() - hours * _HOUR
 
+        # Matches the partial index idx_audit_auth_timestamp
         return self.db.query(AuditLog).filter(
-            AuditLog.action.in_(security_actions),
+            AuditLog.action.like("auth.%"),
             AuditLog.timestamp >= since
         ).order_by(
             AuditLog.timestamp.desc()
@@ -314,7 +317,7 @@ class AuditService:
         Returns:
             List of failed action audit logs
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
+        since = datetime.utcnow() - hours * _HOUR
 
         return self.db.query(AuditLog).filter(
             AuditLog.status.in_(["failure", "error"]),
@@ -391,3 +394,24 @@ class AuditService:
             return request.client.host
 
         return None
+
+
+def write_audit_log(session_factory: Callable[[], Session], **fields) -> None:
+    """
+    Write one audit entry in its own session.
+
+    Meant for BackgroundTasks, so non-critical audit rows commit after the
+    response is sent. Never reuse the request session here: it is closed
+    by then. Failures are logged and swallowed.
+
+    Args:
+        session_factory: Session factory (e.g. SessionLocal)
+        **fields: Keyword arguments for AuditService.log_action()
+    """
+    db = session_factory()
+    try:
+        AuditService(db).log_action(**fields)
+    except Exception as e:
+        logger.warning(f"Audit logging error: {e}")
+    finally:
+        db.close()
@@ -6,27 +6,62 @@ and role-based access control.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from sqlalchemy import delete, literal_column, or_, select
 from sqlalchemy.orm import Session
+import hashlib
 import secrets
 import os
-
-from ..database import get_db
-from ..models.database import User
-from ..auth import hash_password, verify_password, generate_api_key
+import threading
+import time
+
+from ..database import get_db, dialect_insert
+from ..models.database import User, Job, Backlink, Batch, BatchReviewItem, hash_api_key
+from ..auth import (
+    hash_password_async,
+    verify_password_async,
+    generate_api_key,
+    get_user_cached,
+    invalidate_user_cache,
+)
 
 # JWT Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+_ACCESS_TOKEN_LIFETIME = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_LIFETIME = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
 
 # Security scheme
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Decoded tokens keyed by SHA-256 of the raw token. Decoding is a pure
+# function of the token, so entries only need to respect "exp"; user state
+# (status, role) is checked on the user row, which has its own cache.
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "30"))
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+
+def _decode_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing recent results for the same token."""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
+
 
 class AuthService:
     """Enhanced authentication service for Wave 5."""
@@ -38,7 +73,7 @@ class AuthService:
         if expires_delta:
             expire = datetime.utcnow() + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = datetime.utcnow() + _ACCESS_TOKEN_LIFETIME
 
         to_encode.update({"exp": expire, "type": "access"})
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -48,16 +83,32 @@ class AuthService:
     def create_refresh_token(data: dict) -> str:
         """Create JWT refresh token (longer lifetime)."""
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = datetime.utcnow() + _REFRESH_TOKEN_LIFETIME
         to_encode.update({"exp": expire, "type": "refresh"})
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
+    @staticmethod
+    def create_token_pair(user_id: str) -> Tuple[str, str]:
+        """Create an (access, refresh) token pair from a single clock read."""
+        now = datetime.utcnow()
+        access_token = jwt.encode(
+            {"sub": user_id, "exp": now + _ACCESS_TOKEN_LIFETIME, "type": "access"},
+            SECRET_KEY,
+            algorithm=ALGORITHM
+        )
+        refresh_token = jwt.encode(
+            {"sub": user_id, "exp": now + _REFRESH_TOKEN_LIFETIME, "type": "refresh"},
+            SECRET_KEY,
+            algorithm=ALGORITHM
+        )
+        return access_token, refresh_token
+
     @staticmethod
     def verify_token(token: str, token_type: str = "access") -> dict:
         """Verify and decode JWT token."""
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = _decode_token(token)
             if payload.get("type") != token_type:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,7 +123,7 @@ class AuthService:
             )
 
     @staticmethod
-    def register_user(
+    async def register_user(
         email: str,
         password: str,
         full_name: Optional[str],
@@ -81,14 +132,6 @@ class AuthService:
         db: Session
     ) -> User:
         """Register a new user."""
-        # Check if email already exists
-        existing_user = db.query(User).filter(User.email == email).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-
         # Check if username already exists (if provided)
         if username:
             existing_username = db.query(User).filter(User.username == username).first()
@@ -98,28 +141,40 @@ class AuthService:
                     detail="Username already taken"
                 )
 
-        # Create new user
+        # Create new user. ON CONFLICT makes the email check and the insert
+        # one atomic statement, so concurrent registrations cannot race.
         api_key = generate_api_key()
-        user = User(
+        stmt = dialect_insert(db, User).values(
             email=email,
             username=username,
             full_name=full_name,
-            hashed_password=hash_password(password),
-            api_key=api_key,
+            hashed_password=await hash_password_async(password),
+            api_key_hash=hash_api_key(api_key),
             role=role,
             account_status="active",
             is_active=True,
             is_admin=(role == "admin")
-        )
+        ).on_conflict_do_nothing(
+            index_elements=["email"]
+        ).returning(User.id)
+
+        row = db.execute(stmt).first()
+        if row is None:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
 
-        db.add(user)
         db.commit()
-        db.refresh(user)
 
+        user = db.get(User, row.id)
+        # Only the hash was stored; attach the key so this response can show it once
+        user.api_key = api_key
         return user
 
     @staticmethod
-    def authenticate_user(email: str, password: str, db: Session) -> Optional[User]:
+    async def authenticate_user(email: str, password: str, db: Session) -> Optional[User]:
         """Authenticate user with email and password."""
         user = db.query(User).filter(User.email == email).first()
 
@@ -129,12 +184,13 @@ class AuthService:
         if not user.hashed_password:
             return None
 
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
 
         # Update last login
         user.last_login = datetime.utcnow()
         db.commit()
+        invalidate_user_cache(user.id)
 
         return user
 
@@ -148,7 +204,7 @@ class AuthService:
         return reset_token
 
     @staticmethod
-    def reset_password(reset_token: str, new_password: str, db: Session) -> bool:
+    async def reset_password(reset_token: str, new_password: str, db: Session) -> bool:
         """Reset user password with reset token."""
         user = db.query(User).filter(User.reset_token == reset_token).first()
 
@@ -159,10 +215,11 @@ class AuthService:
             return False
 
         # Update password and clear reset token
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await hash_password_async(new_password)
         user.reset_token = None
         user.reset_token_expires = None
         db.commit()
+        invalidate_user_cache(user.id)
 
         return True
 
@@ -181,6 +238,46 @@ class AuthService:
         user.jobs_created_count += 1
         user.tokens_used += tokens_used
         db.commit()
+        invalidate_user_cache(user.id)
+
+    @staticmethod
+    def delete_user(user_id: str, db: Session):
+        """
+        Permanently delete a user and everything they own.
+
+        Issues one DELETE per table instead of letting the ORM cascade load
+        and delete each job, backlink and batch row individually. On
+        PostgreSQL the deletes are chained as data-modifying CTEs, so the
+        whole cascade is a single statement and round trip.
+        """
+        user_batches = select(Batch.id).where(Batch.user_id == user_id)
+        user_jobs = select(Job.id).where(Job.user_id == user_id)
+
+        # Children first: review items reference both batches and jobs
+        child_deletes = [
+            delete(BatchReviewItem).where(or_(
+                BatchReviewItem.batch_id.in_(user_batches),
+                BatchReviewItem.job_id.in_(user_jobs)
+            )),
+            delete(Batch).where(Batch.user_id == user_id),
+            delete(Job).where(Job.user_id == user_id),
+            delete(Backlink).where(Backlink.user_id == user_id),
+        ]
+        delete_user = delete(User).where(User.id == user_id)
+
+        if db.get_bind().dialect.name == "postgresql":
+            # Foreign keys are checked at the end of the statement, after all CTEs ran
+            db.execute(delete_user.add_cte(*(
+                stmt.returning(literal_column("1")).cte(f"deleted_{index}")
+                for index, stmt in enumerate(child_deletes)
+            )))
+        else:
+            for stmt in child_deletes:
+                db.execute(stmt)
+            db.execute(delete_user)
+
+        db.commit()
+        invalidate_user_cache(user_id)
 
 
 async def get_current_user_jwt(
@@ -205,8 +302,8 @@ async def get_current_user_jwt(
             detail="Could not validate credentials"
         )
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user (cached for a short TTL)
+    user = get_user_cached(user_id, db)
 
     if user is None:
         raise HTTPException(
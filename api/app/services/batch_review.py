@@ -9,15 +9,29 @@ Handles business logic for:
 - Exporting approved batches
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload
+from sqlalchemy import func, and_, or_, case, select, update
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import json
 from pathlib import Path
 
+from ..database import in_values
 from ..models.database import Batch, BatchReviewItem, Job, User
 from ..core.bacowr_wrapper import bacowr
+from ..core.cache import invalidate_job_counts
+
+# Fields of one exported item, in output (CSV column) order
+EXPORT_FIELDS = [
+    "job_id", "publisher_domain", "target_url", "anchor_text", "article_text",
+    "qc_score", "qc_status", "reviewer_notes", "reviewed_at", "job_package",
+]
+
+
+def _export_record(reviewed_at: Optional[datetime], **fields) -> Dict[str, Any]:
+    """Build one exported item."""
+    fields["reviewed_at"] = reviewed_at.isoformat() if reviewed_at else None
+    return {field: fields[field] for field in EXPORT_FIELDS}
 
 
 class BatchReviewService:
@@ -33,6 +47,9 @@ class BatchReviewService:
         """
         self.db = db
         self.user_id = user_id
+        # get_batch() results for this request: routes check the batch
+        # exists and then call methods that look it up again
+        self._batches: Dict[str, Optional[Batch]] = {}
 
     def create_batch_from_jobs(
         self,
@@ -56,10 +73,17 @@ class BatchReviewService:
         Raises:
             ValueError: If jobs not found, not owned by user, or not completed
         """
-        # Validate all jobs exist and are owned by user
-        jobs = self.db.query(Job).filter(
+        # Validate all jobs exist and are owned by user. One IN query, and
+        # only the columns used below (not article text or job packages).
+        jobs = self.db.query(Job).options(
+            load_only(
+                Job.id, Job.status,
+                Job.qc_score, Job.qc_status, Job.qc_issues_count,
+                Job.estimated_cost, Job.actual_cost
+            )
+        ).filter(
             and_(
-                Job.id.in_(job_ids),
+                in_values(self.db, Job.id, job_ids),
                 Job.user_id == self.user_id
             )
         ).all()
@@ -109,19 +133,14 @@ class BatchReviewService:
 
         # Create batch review items
         for job in jobs:
-            # Extract QC data from job
-            qc_report = job.qc_report or {}
-            qc_score = qc_report.get('score')
-            qc_status = qc_report.get('status')
-            qc_issues_count = len(qc_report.get('issues', []))
-
+            # QC snapshot from the job's stored summary
             item = BatchReviewItem(
                 batch_id=batch.id,
                 job_id=job.id,
                 review_status="pending",
-                qc_score=qc_score,
-                qc_status=qc_status,
-                qc_issues_count=qc_issues_count
+                qc_score=job.qc_score,
+                qc_status=job.qc_status,
+                qc_issues_count=job.qc_issues_count
             )
             self.db.add(item)
 
@@ -144,12 +163,15 @@ class BatchReviewService:
         Returns:
             Batch object or None
         """
-        return self.db.query(Batch).filter(
-            and_(
-                Batch.id == batch_id,
-                Batch.user_id == self.user_id
-            )
-        ).first()
+        if batch_id not in self._batches:
+            self._batches[batch_id] = self.db.query(Batch).filter(
+                and_(
+                    Batch.id == batch_id,
+                    Batch.user_id == self.user_id
+                )
+            ).first()
+
+        return self._batches[batch_id]
 
     def get_batch_items(
         self,
@@ -195,14 +217,46 @@ class BatchReviewService:
         # Get total count
         total = query.count()
 
-        # Get items with pagination
-        items = query.order_by(
+        # Get items with pagination (jobs joined in, not fetched per item;
+        # any other relationship access raises rather than lazy loading)
+        items = query.options(
+            joinedload(BatchReviewItem.job).raiseload("*"),
+            raiseload("*")
+        ).order_by(
             BatchReviewItem.qc_score.desc().nullslast(),
             BatchReviewItem.created_at
         ).limit(limit).offset(offset).all()
 
         return items, total
 
+    def get_review_groups(self, batch_id: str) -> List[Tuple[Any, ...]]:
+        """
+        Item counts per (qc_status, review_status) for a batch.
+
+        Aggregated live, so the counts always match the batch counters;
+        idx_batch_item_stats covers the query.
+
+        Args:
+            batch_id: Batch ID (ownership must already be checked)
+
+        Returns:
+            Rows of (qc_status, review_status, item_count, score_sum, scored_count)
+        """
+        query = select(
+            BatchReviewItem.qc_status,
+            BatchReviewItem.review_status,
+            func.count(),
+            func.sum(BatchReviewItem.qc_score),
+            func.count(BatchReviewItem.qc_score)
+        ).where(
+            BatchReviewItem.batch_id == batch_id
+        ).group_by(
+            BatchReviewItem.qc_status,
+            BatchReviewItem.review_status
+        )
+
+        return self.db.execute(query).all()
+
     def approve_item(
         self,
         batch_id: str,
@@ -293,6 +347,121 @@ class BatchReviewService:
 
         return item
 
+    def bulk_review(
+        self,
+        batch_id: str,
+        decisions: List[Tuple[str, str, Optional[str]]]
+    ) -> Batch:
+        """
+        Apply many review decisions in one transaction.
+
+        Follows the same rules as approve_item/reject_item/regenerate_item,
+        but issues one UPDATE per distinct decision plus one counter update
+        on the batch, instead of a round trip and commit per item.
+
+        Args:
+            batch_id: Batch ID
+            decisions: (item_id, decision, reviewer_notes) tuples
+
+        Returns:
+            Updated Batch
+
+        Raises:
+            ValueError: If batch or any item not found, an item appears
+                twice, or any decision is invalid for the item's status.
+                Nothing is applied in that case.
+        """
+        batch = self.get_batch(batch_id)
+        if not batch:
+            raise ValueError(f"Batch not found: {batch_id}")
+
+        item_ids = [item_id for item_id, _, _ in decisions]
+        if len(set(item_ids)) != len(item_ids):
+            raise ValueError("Each item may only appear once per bulk review")
+
+        current_status = dict(self.db.execute(
+            select(BatchReviewItem.id, BatchReviewItem.review_status).where(
+                BatchReviewItem.batch_id == batch_id,
+                in_values(self.db, BatchReviewItem.id, item_ids)
+            )
+        ).all())
+
+        missing_ids = set(item_ids) - current_status.keys()
+        if missing_ids:
+            raise ValueError(f"Batch items not found: {missing_ids}")
+
+        # Validate everything before writing anything
+        by_decision: Dict[str, Dict[str, Optional[str]]] = {}
+        for item_id, decision, reviewer_notes in decisions:
+            review_status = current_status[item_id]
+            if decision in ("approved", "rejected"):
+                if review_status != "pending":
+                    raise ValueError(
+                        f"Item {item_id} already reviewed with status: {review_status}"
+                    )
+            elif decision == "needs_regeneration":
+                if review_status == "approved":
+                    raise ValueError(f"Cannot regenerate approved item: {item_id}")
+            else:
+                raise ValueError(f"Invalid decision: {decision}")
+
+            by_decision.setdefault(decision, {})[item_id] = reviewer_notes
+
+        reviewed_at = datetime.utcnow()
+        for decision, notes_by_id in by_decision.items():
+            if any(notes_by_id.values()):
+                reviewer_notes = case(notes_by_id, value=BatchReviewItem.id, else_=None)
+            else:
+                reviewer_notes = None
+
+            conditions = [
+                BatchReviewItem.batch_id == batch_id,
+                in_values(self.db, BatchReviewItem.id, notes_by_id)
+            ]
+            if decision != "needs_regeneration":
+                # Guards against a concurrent review of the same items
+                conditions.append(BatchReviewItem.review_status == "pending")
+
+            result = self.db.execute(
+                update(BatchReviewItem).where(*conditions).values(
+                    review_status=decision,
+                    reviewer_notes=reviewer_notes,
+                    reviewed_by=self.user_id,
+                    reviewed_at=reviewed_at
+                ).execution_options(synchronize_session=False)
+            )
+            if result.rowcount != len(notes_by_id):
+                self.db.rollback()
+                raise ValueError("Batch items changed during review, please retry")
+
+        approved = len(by_decision.get("approved", ()))
+        rejected = len(by_decision.get("rejected", ()))
+        if approved or rejected:
+            # Relative updates, so concurrent reviews cannot overwrite each other
+            self.db.execute(
+                update(Batch).where(Batch.id == batch_id).values(
+                    items_approved=Batch.items_approved + approved,
+                    items_rejected=Batch.items_rejected + rejected,
+                    items_pending_review=Batch.items_pending_review - (approved + rejected)
+                ).execution_options(synchronize_session=False)
+            )
+            self.db.execute(
+                update(Batch).where(
+                    Batch.id == batch_id,
+                    Batch.items_pending_review == 0,
+                    Batch.status != "completed"
+                ).values(
+                    status="completed",
+                    completed_at=reviewed_at,
+                    review_completed_at=reviewed_at
+                ).execution_options(synchronize_session=False)
+            )
+
+        self.db.commit()
+        self.db.refresh(batch)
+
+        return batch
+
     def regenerate_item(
         self,
         batch_id: str,
@@ -377,6 +546,8 @@ class BatchReviewService:
                 country=original_job.country,
                 enable_llm_profiling=original_job.enable_llm_profiling
             )
+            metrics = result.get('metrics')
+            generation = metrics.get('generation', {}) if metrics else {}
 
             # Create new job record
             new_job = Job(
@@ -394,8 +565,8 @@ class BatchReviewService:
                 job_package=result.get('job_package'),
                 qc_report=result.get('qc_report'),
                 execution_log=result.get('execution_log'),
-                metrics=result.get('metrics'),
-                actual_cost=result.get('metrics', {}).get('generation', {}).get('cost'),
+                metrics=metrics,
+                actual_cost=generation.get('cost'),
                 started_at=datetime.utcnow(),
                 completed_at=datetime.utcnow()
             )
@@ -408,12 +579,12 @@ class BatchReviewService:
             item.regeneration_count += 1
 
             # Update QC snapshot
-            qc_report = new_job.qc_report or {}
-            item.qc_score = qc_report.get('score')
-            item.qc_status = qc_report.get('status')
-            item.qc_issues_count = len(qc_report.get('issues', []))
+            item.qc_score = new_job.qc_score
+            item.qc_status = new_job.qc_status
+            item.qc_issues_count = new_job.qc_issues_count
 
             self.db.commit()
+            invalidate_job_counts(self.user_id)
             self.db.refresh(item)
 
             return item
@@ -468,18 +639,18 @@ class BatchReviewService:
 
         for item in approved_items:
             job = item.job
-            export_data["items"].append({
-                "job_id": job.id,
-                "publisher_domain": job.publisher_domain,
-                "target_url": job.target_url,
-                "anchor_text": job.anchor_text,
-                "article_text": job.article_text,
-                "qc_score": item.qc_score,
-                "qc_status": item.qc_status,
-                "reviewer_notes": item.reviewer_notes,
-                "reviewed_at": item.reviewed_at.isoformat() if item.reviewed_at else None,
-                "job_package": job.job_package
-            })
+            export_data["items"].append(_export_record(
+                job_id=job.id,
+                publisher_domain=job.publisher_domain,
+                target_url=job.target_url,
+                anchor_text=job.anchor_text,
+                article_text=job.article_text,
+                qc_score=item.qc_score,
+                qc_status=item.qc_status,
+                reviewer_notes=item.reviewer_notes,
+                reviewed_at=item.reviewed_at,
+                job_package=job.job_package
+            ))
 
         # Write to file
         export_dir = Path("storage/exports")
@@ -503,6 +674,47 @@ class BatchReviewService:
             "created_at": datetime.utcnow()
         }
 
+    def iter_approved_items(self, batch_id: str, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield export records for a batch's approved items.
+
+        Rows are fetched chunk_size at a time as plain columns (no ORM
+        instances), so memory stays flat however large the batch is.
+
+        Args:
+            batch_id: Batch ID
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Export record dicts (same shape as export_approved_batch items)
+        """
+        query = select(
+            Job.id.label("job_id"),
+            Job.publisher_domain,
+            Job.target_url,
+            Job.anchor_text,
+            Job.article_text,
+            BatchReviewItem.qc_score,
+            BatchReviewItem.qc_status,
+            BatchReviewItem.reviewer_notes,
+            BatchReviewItem.reviewed_at,
+            Job.job_package
+        ).join(
+            Job, Job.id == BatchReviewItem.job_id
+        ).join(
+            Batch, Batch.id == BatchReviewItem.batch_id
+        ).where(
+            BatchReviewItem.batch_id == batch_id,
+            Batch.user_id == self.user_id,
+            BatchReviewItem.review_status == "approved"
+        ).order_by(
+            BatchReviewItem.qc_score.desc().nullslast(),
+            BatchReviewItem.created_at
+        )
+
+        for row in self.db.execute(query).yield_per(chunk_size):
+            yield _export_record(**row._mapping)
+
     def _get_item_for_review(self, batch_id: str, item_id: str) -> BatchReviewItem:
         """
         Get batch item for review, with validation.
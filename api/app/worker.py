@@ -0,0 +1,112 @@
+"""
+Job worker process.
+
+Runs the content generation jobs queued by POST /jobs (see core.job_queue)
+outside the API process. Start as many workers as throughput requires:
+
+    cd api && REDIS_URL=redis://localhost:6379 python -m app.worker
+
+Each worker needs a stable WORKER_ID that no other running worker shares
+(the hostname by default): on restart, a worker re-runs the jobs it had
+taken under that ID but not finished.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Dict
+
+from sqlalchemy import update
+
+from .core.job_queue import job_queue
+from .database import AsyncSessionLocal, async_engine
+from .models.database import Job
+from .models.schemas import JobCreate, JobStatus
+from .routes.jobs import run_job_background
+
+logger = logging.getLogger(__name__)
+
+# Jobs one worker process runs at the same time
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "4"))
+
+# Names this worker's processing list in the queue
+WORKER_ID = os.getenv("WORKER_ID", socket.gethostname())
+
+
+async def run_queued_job(message: Dict[str, Any]) -> None:
+    """Run one job descriptor from the queue."""
+    await run_job_background(
+        message["job_id"],
+        JobCreate(**message["job_create"])
+    )
+
+
+async def recover_unfinished_jobs() -> None:
+    """
+    Re-run the jobs this worker was running when it last stopped.
+
+    They are still marked processing, which run_job_background will not
+    claim, so they are reset to pending before going back on the queue.
+    """
+    job_ids = [message["job_id"] for message in await job_queue.unfinished(WORKER_ID)]
+    if not job_ids:
+        return
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Job).where(
+                Job.id.in_(job_ids),
+                Job.status == JobStatus.PROCESSING
+            ).values(status=JobStatus.PENDING, started_at=None)
+        )
+        await db.commit()
+
+    await job_queue.requeue_unfinished(WORKER_ID)
+    logger.info(f"Requeued {len(job_ids)} unfinished job(s) from a previous run")
+
+
+async def run_and_ack(message: Dict[str, Any], payload: bytes) -> None:
+    """
+    Run a dequeued job, then remove it from this worker's processing list.
+
+    A job that raises or is cancelled by shutdown stays on the list and is
+    re-run when the worker restarts.
+    """
+    await run_queued_job(message)
+    await job_queue.ack(WORKER_ID, payload)
+
+
+async def main() -> None:
+    """Consume the job queue until interrupted."""
+    if not job_queue.enabled:
+        raise SystemExit("REDIS_URL must be set to run the job worker")
+
+    slots = asyncio.Semaphore(WORKER_CONCURRENCY)
+    running = set()
+
+    def finished(task: asyncio.Task) -> None:
+        running.discard(task)
+        slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Queued job failed: {task.exception()}")
+
+    logger.info(f"Job worker {WORKER_ID} started (concurrency {WORKER_CONCURRENCY})")
+
+    try:
+        await recover_unfinished_jobs()
+
+        while True:
+            await slots.acquire()
+            message, payload = await job_queue.dequeue(WORKER_ID)
+
+            task = asyncio.create_task(run_and_ack(message, payload))
+            running.add(task)
+            task.add_done_callback(finished)
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+    asyncio.run(main())
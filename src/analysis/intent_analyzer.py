@@ -5,6 +5,7 @@ Part of Del 3B: Content Generation Pipeline
 Matches SERP intent vs target vs publisher vs anchor
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 
 
@@ -283,6 +284,17 @@ class IntentAnalyzer:
         Returns:
             'aligned' | 'partial' | 'off'
         """
+        return self._pair_alignment(intent1, intent2)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _pair_alignment(cls, intent1: str, intent2: str) -> str:
+        """
+        Alignment of an intent pair, computed once per pair.
+
+        The intent vocabulary is small and every analysis checks three
+        pairs, so results are memoized per (class, intent1, intent2).
+        """
         # Exact match
         if intent1 == intent2:
             return 'aligned'
@@ -298,13 +310,13 @@ class IntentAnalyzer:
         # Check compatibility using full intent first, then base
         # Check intent1 -> intent2
         for key in [intent1, intent1_base]:
-            compatible = self.INTENT_COMPATIBILITY.get(key, [])
+            compatible = cls.INTENT_COMPATIBILITY.get(key, [])
             if intent2 in compatible or intent2_base in compatible:
                 return 'partial'
 
         # Check intent2 -> intent1
         for key in [intent2, intent2_base]:
-            compatible = self.INTENT_COMPATIBILITY.get(key, [])
+            compatible = cls.INTENT_COMPATIBILITY.get(key, [])
             if intent1 in compatible or intent1_base in compatible:
                 return 'partial'
 
@@ -15,6 +15,8 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
+from .rate_limit import RateLimitedHttpRequest
+
 
 class GoogleAuthManager:
     """
@@ -162,7 +164,11 @@ class GoogleAuthManager:
         if not self.credentials:
             self.authenticate()
 
-        return build('sheets', 'v4', credentials=self.credentials)
+        return build(
+            'sheets', 'v4',
+            credentials=self.credentials,
+            requestBuilder=RateLimitedHttpRequest
+        )
 
     def get_docs_service(self):
         """
@@ -174,7 +180,11 @@ class GoogleAuthManager:
         if not self.credentials:
             self.authenticate()
 
-        return build('docs', 'v1', credentials=self.credentials)
+        return build(
+            'docs', 'v1',
+            credentials=self.credentials,
+            requestBuilder=RateLimitedHttpRequest
+        )
 
     def get_drive_service(self):
         """
@@ -186,7 +196,11 @@ class GoogleAuthManager:
         if not self.credentials:
             self.authenticate()
 
-        return build('drive', 'v3', credentials=self.credentials)
+        return build(
+            'drive', 'v3',
+            credentials=self.credentials,
+            requestBuilder=RateLimitedHttpRequest
+        )
 
     @staticmethod
     def create_service_account_instructions() -> str:
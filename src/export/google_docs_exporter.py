@@ -5,10 +5,11 @@ Exports BACOWR articles to Google Docs with formatting.
 Creates properly formatted documents with headings, paragraphs, and highlighted backlinks.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from googleapiclient.errors import HttpError
 
 from .google_auth import GoogleAuthManager
+from .rate_limit import google_api_limiter
 
 
 class GoogleDocsExporter:
@@ -23,6 +24,12 @@ class GoogleDocsExporter:
     - Metadata footer
     """
 
+    # Max sub-requests per batch HTTP call (Drive caps batches at 100)
+    BATCH_SIZE = 100
+
+    DOCUMENT_MIME_TYPE = 'application/vnd.google-apps.document'
+    FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
     def __init__(self, auth_manager: Optional[GoogleAuthManager] = None):
         """
         Initialize Google Docs Exporter.
@@ -103,6 +110,39 @@ class GoogleDocsExporter:
         metadata: Optional[Dict[str, Any]]
     ):
         """Add formatted content to document."""
+        requests, formatting_requests = self._content_requests(
+            title,
+            content,
+            backlink_info,
+            metadata
+        )
+
+        # Execute text insertion
+        self.docs_service.documents().batchUpdate(
+            documentId=document_id,
+            body={'requests': requests}
+        ).execute()
+
+        # Apply formatting (headings, bold, links, etc.)
+        if formatting_requests:
+            self.docs_service.documents().batchUpdate(
+                documentId=document_id,
+                body={'requests': formatting_requests}
+            ).execute()
+
+    def _content_requests(
+        self,
+        title: str,
+        content: str,
+        backlink_info: Optional[Dict[str, str]],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Build the Docs API requests that fill an empty document.
+
+        Returns:
+            Tuple of (text insertion requests, formatting requests)
+        """
         requests = []
 
         # Parse and format content
@@ -134,23 +174,13 @@ class GoogleDocsExporter:
             }
         })
 
-        # Execute text insertion
-        self.docs_service.documents().batchUpdate(
-            documentId=document_id,
-            body={'requests': requests}
-        ).execute()
-
-        # Apply formatting (headings, bold, links, etc.)
+        # Formatting (headings, bold, links, etc.)
         formatting_requests = self._create_formatting_requests(
             sections,
             backlink_info
         )
 
-        if formatting_requests:
-            self.docs_service.documents().batchUpdate(
-                documentId=document_id,
-                body={'requests': formatting_requests}
-            ).execute()
+        return requests, formatting_requests
 
     def _parse_content(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -358,6 +388,217 @@ class GoogleDocsExporter:
         Returns:
             Dictionary with document_id and document_url
         """
+        return self.create_document(
+            **self._job_document_fields(job_data),
+            share_with_email=share_with_email
+        )
+
+    def export_jobs_to_docs_batch(
+        self,
+        job_list: List[Dict[str, Any]],
+        share_with_email: Optional[str] = None,
+        folder_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Export many BACOWR jobs to Google Docs with batched API calls.
+
+        Documents are created, filled and shared with one batch HTTP request
+        per step (per BATCH_SIZE jobs) instead of one request per job and step.
+
+        Args:
+            job_list: Job data dictionaries from database
+            share_with_email: Optional email to share every document with
+            folder_id: Optional Drive folder to create the documents in (see
+                create_shared_folder; its sharing applies to the documents)
+
+        Returns:
+            Mapping of job ID to document URL (jobs that failed are left out)
+        """
+        self._ensure_authenticated()
+
+        job_fields = {
+            str(job_data.get('id', '')): self._job_document_fields(job_data)
+            for job_data in job_list
+        }
+
+        # Create empty documents
+        if folder_id:
+            # The Docs API cannot place documents in a folder; Drive can
+            created = self._execute_batch(
+                self.drive_service,
+                {
+                    job_id: self.drive_service.files().create(
+                        body={
+                            'name': fields['title'],
+                            'mimeType': self.DOCUMENT_MIME_TYPE,
+                            'parents': [folder_id]
+                        },
+                        fields='id'
+                    )
+                    for job_id, fields in job_fields.items()
+                },
+                'create document'
+            )
+            document_ids = {
+                job_id: doc['id'] for job_id, doc in created.items()
+            }
+        else:
+            created = self._execute_batch(
+                self.docs_service,
+                {
+                    job_id: self.docs_service.documents().create(
+                        body={'title': fields['title']}
+                    )
+                    for job_id, fields in job_fields.items()
+                },
+                'create document'
+            )
+            document_ids = {
+                job_id: doc['documentId'] for job_id, doc in created.items()
+            }
+
+        # Insert and format content; the requests in one batchUpdate are
+        # applied in order, so insertion and formatting can share a call
+        updated = {}
+        for job_id, document_id in document_ids.items():
+            fields = job_fields[job_id]
+            requests, formatting_requests = self._content_requests(
+                fields['title'],
+                fields['content'],
+                fields['backlink_info'],
+                fields['metadata']
+            )
+            updated[job_id] = self.docs_service.documents().batchUpdate(
+                documentId=document_id,
+                body={'requests': requests + formatting_requests}
+            )
+        filled = self._execute_batch(self.docs_service, updated, 'add content')
+
+        # Share documents; a failed share keeps the document
+        if share_with_email:
+            self.share_documents(
+                [document_ids[job_id] for job_id in filled],
+                share_with_email
+            )
+
+        return {
+            job_id: self.get_document_url(document_ids[job_id])
+            for job_id in filled
+        }
+
+    def create_shared_folder(
+        self,
+        name: str,
+        email: str,
+        role: str = 'writer'
+    ) -> str:
+        """
+        Create a Drive folder and share it with email.
+
+        Documents created in the folder inherit its permission, so a batch
+        is shared with one request instead of one per document.
+
+        Args:
+            name: Folder name
+            email: Email to share with
+            role: Permission role ('reader', 'writer', 'owner')
+
+        Returns:
+            Folder ID
+        """
+        self._ensure_authenticated()
+
+        folder = self.drive_service.files().create(
+            body={'name': name, 'mimeType': self.FOLDER_MIME_TYPE},
+            fields='id'
+        ).execute()
+        folder_id = folder['id']
+
+        self._share_document(folder_id, email, role)
+
+        return folder_id
+
+    def share_documents(
+        self,
+        document_ids: List[str],
+        email: str,
+        role: str = 'writer'
+    ) -> List[str]:
+        """
+        Share many documents with email using batched Drive requests.
+
+        Args:
+            document_ids: Document IDs to share
+            email: Email to share with
+            role: Permission role ('reader', 'writer', 'owner')
+
+        Returns:
+            IDs of the documents that were shared (failures are logged)
+        """
+        self._ensure_authenticated()
+
+        permission = {
+            'type': 'user',
+            'role': role,
+            'emailAddress': email
+        }
+
+        shared = self._execute_batch(
+            self.drive_service,
+            {
+                document_id: self.drive_service.permissions().create(
+                    fileId=document_id,
+                    body=permission,
+                    fields='id'
+                )
+                for document_id in document_ids
+            },
+            'share document'
+        )
+
+        return list(shared)
+
+    def _execute_batch(
+        self,
+        service,
+        requests: Dict[str, Any],
+        action: str
+    ) -> Dict[str, Any]:
+        """
+        Execute API requests in batch HTTP calls of up to BATCH_SIZE each.
+
+        Args:
+            service: API service the requests belong to
+            requests: Mapping of request ID to unexecuted API request
+            action: Description used in failure warnings
+
+        Returns:
+            Mapping of request ID to response for the requests that succeeded
+        """
+        responses = {}
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                print(f"Warning: Failed to {action} for {request_id}: {exception}")
+            else:
+                responses[request_id] = response
+
+        items = list(requests.items())
+        for start in range(0, len(items), self.BATCH_SIZE):
+            chunk = items[start:start + self.BATCH_SIZE]
+            batch = service.new_batch_http_request(callback=callback)
+            for request_id, request in chunk:
+                batch.add(request, request_id=request_id)
+
+            # Each sub-request counts against the per-minute quota
+            google_api_limiter.acquire(len(chunk))
+            batch.execute()
+
+        return responses
+
+    @staticmethod
+    def _job_document_fields(job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Document title, content, backlink and metadata for a job."""
         # Extract data
         publisher = job_data.get('publisher_domain', 'Unknown')
         anchor_text = job_data.get('anchor_text', '')
@@ -383,14 +624,12 @@ class GoogleDocsExporter:
             'QC Score': str(job_data.get('qc_report', {}).get('score', 'N/A'))
         }
 
-        # Create document
-        return self.create_document(
-            title=title,
-            content=article_text,
-            backlink_info=backlink_info,
-            metadata=metadata,
-            share_with_email=share_with_email
-        )
+        return {
+            'title': title,
+            'content': article_text,
+            'backlink_info': backlink_info,
+            'metadata': metadata
+        }
 
     def get_document_url(self, document_id: str) -> str:
         """Get shareable URL for document."""
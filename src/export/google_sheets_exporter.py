@@ -194,7 +194,8 @@ class GoogleSheetsExporter:
 
         Args:
             spreadsheet_id: Target spreadsheet ID
-            job_data: Job data dictionary (from database Job model)
+            job_data: Job data dictionary (from database Job model); a
+                precomputed 'word_count' is used instead of 'article_text'
             doc_url: Optional link to Google Doc with full article
 
         Returns:
@@ -210,7 +211,10 @@ class GoogleSheetsExporter:
         anchor_text = job_data.get('anchor_text', '')
         status = job_data.get('status', '')
         qc_score = self._extract_qc_score(job_data.get('qc_report'))
-        word_count = self._extract_word_count(job_data.get('article_text'))
+        word_count = (
+            job_data['word_count'] if 'word_count' in job_data
+            else self._extract_word_count(job_data.get('article_text'))
+        )
         cost = job_data.get('actual_cost', job_data.get('estimated_cost', 0.0))
 
         # Format created_at
@@ -436,6 +440,7 @@ class GoogleSheetsExporter:
             return None
         return len(article_text.split())
 
-    def get_spreadsheet_url(self, spreadsheet_id: str) -> str:
+    @staticmethod
+    def get_spreadsheet_url(spreadsheet_id: str) -> str:
         """Get shareable URL for spreadsheet."""
         return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
@@ -0,0 +1,83 @@
+"""
+Google API Rate Limiting
+
+Process-wide token bucket shared by all Google API calls made by the
+exporters. Calls wait for a token instead of tripping the per-user
+per-minute quotas and failing with 429.
+"""
+
+import os
+import threading
+import time
+
+from googleapiclient.http import HttpRequest
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to `rate` tokens and refills at `rate` tokens per `period`
+    seconds. acquire() blocks until the requested tokens are available.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens available per period (also the burst size)
+            period: Refill period in seconds
+        """
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Take tokens from the bucket, waiting for refills as needed.
+
+        Tokens are taken one at a time, so requests for more tokens than
+        the bucket holds still complete.
+        """
+        for _ in range(tokens):
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._tokens = min(
+                        self.capacity,
+                        self._tokens + (now - self._updated) * self.fill_rate
+                    )
+                    self._updated = now
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+
+                    wait = (1 - self._tokens) / self.fill_rate
+
+                time.sleep(wait)
+
+
+# Sheets/Docs/Drive allow 60 requests per minute per user; keep a margin
+google_api_limiter = TokenBucket(
+    float(os.getenv('GOOGLE_API_REQUESTS_PER_MINUTE', '55')),
+    period=60.0
+)
+
+# Retries (with exponential backoff) for 429 and 5xx responses that still occur
+GOOGLE_API_NUM_RETRIES = int(os.getenv('GOOGLE_API_NUM_RETRIES', '3'))
+
+
+class RateLimitedHttpRequest(HttpRequest):
+    """HttpRequest that takes a google_api_limiter token before executing."""
+
+    def execute(self, http=None, num_retries=None):
+        google_api_limiter.acquire()
+
+        if num_retries is None:
+            num_retries = GOOGLE_API_NUM_RETRIES
+
+        return super().execute(http=http, num_retries=num_retries)
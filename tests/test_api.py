@@ -9,8 +9,10 @@ Per BUILDER_PROMPT.md STEG 12.6
 
 import pytest
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 import uuid
 
 # Add project root to path
@@ -19,7 +21,7 @@ sys.path.insert(0, str(project_root))
 
 # Import after path setup
 from api.app.main import app
-from api.app.database import Base, engine
+from api.app.database import Base, async_engine, engine
 from api.app.models.database import User
 from api.app.auth import generate_api_key
 
@@ -32,6 +34,24 @@ TEST_API_KEY = None
 TEST_USER_ID = None
 
 
+@contextmanager
+def count_queries():
+    """Count SQL statements executed on the sync and async engines inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engines = (engine, async_engine.sync_engine)
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture(scope="module", autouse=True)
 def setup_test_db():
     """Setup test database before tests."""
@@ -113,6 +133,75 @@ class TestAuthentication:
         response = client.get("/api/v1/jobs", headers=headers)
         assert response.status_code == 200
 
+    def test_api_key_resolves_by_digest(self):
+        """Test the X-API-Key header is matched against the stored SHA-256 digest."""
+        from api.app.database import SessionLocal
+        from api.app.models.database import hash_api_key
+
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.api_key_hash == hash_api_key(TEST_API_KEY)).first()
+            assert user is not None
+            assert user.id == TEST_USER_ID
+        finally:
+            db.close()
+
+        response = client.get("/api/v1/users/me", headers={"X-API-Key": TEST_API_KEY})
+        assert response.status_code == 200
+        assert response.json()["id"] == TEST_USER_ID
+
+    def test_api_key_not_stored(self):
+        """Test a user reloaded from the database has no plaintext API key."""
+        from api.app.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            user = db.get(User, TEST_USER_ID)
+            assert user.api_key is None
+            assert user.api_key_hash is not None
+        finally:
+            db.close()
+
+    def test_deactivation_seen_without_shared_cache(self):
+        """Test a user deactivated by another process is rejected at once without Redis."""
+        from sqlalchemy import update
+        from api.app.core.cache import cache
+        from api.app.database import SessionLocal
+
+        if cache.shared:
+            pytest.skip("user cache is shared through Redis")
+
+        api_key = generate_api_key()
+        db = SessionLocal()
+        try:
+            user = User(
+                email=f"{uuid.uuid4().hex}@bacowr.test",
+                api_key=api_key,
+                is_active=True,
+                is_admin=True
+            )
+            db.add(user)
+            db.commit()
+
+            headers = {"X-API-Key": api_key}
+            assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+
+            # Written directly, as another worker would: no cache invalidation here
+            db.execute(update(User).where(User.id == user.id).values(is_active=False))
+            db.commit()
+
+            assert client.get("/api/v1/users/me", headers=headers).status_code == 403
+        finally:
+            db.close()
+
+
+def jwt_headers() -> dict:
+    """Bearer token headers for the test user (the jobs routes take JWT auth)."""
+    from api.app.services.auth_service import AuthService
+
+    access_token, _ = AuthService.create_token_pair(TEST_USER_ID)
+    return {"Authorization": f"Bearer {access_token}"}
+
 
 class TestJobsEndpoints:
     """Test job creation and management endpoints."""
@@ -181,6 +270,128 @@ class TestJobsEndpoints:
         response = client.post("/api/v1/jobs", json=job_data, headers=headers)
         assert response.status_code == 422  # Validation error
 
+    def test_create_job_idempotency_key(self):
+        """Test repeating an Idempotency-Key returns the first job instead of a new one."""
+        headers = {**jwt_headers(), "Idempotency-Key": uuid.uuid4().hex}
+        job_data = {
+            "publisher_domain": "example.com",
+            "target_url": "https://target.com/page",
+            "anchor_text": "test anchor"
+        }
+
+        first = client.post("/api/v1/jobs", json=job_data, headers=headers)
+        assert first.status_code == 201
+
+        replay = client.post("/api/v1/jobs", json=job_data, headers=headers)
+        assert replay.status_code == 200
+        assert replay.json()["id"] == first.json()["id"]
+
+    def test_list_jobs_cursor_paging(self):
+        """Test following next_cursor visits every job once."""
+        from api.app.database import SessionLocal
+        from api.app.models.database import Job
+
+        db = SessionLocal()
+        try:
+            # Created together, so several share a created_at and the id
+            # tie-breaker decides the order
+            jobs = [
+                Job(
+                    user_id=TEST_USER_ID,
+                    publisher_domain="example.com",
+                    target_url="https://target.com/page",
+                    anchor_text=f"cursor anchor {i}",
+                    status="delivered"
+                )
+                for i in range(5)
+            ]
+            db.add_all(jobs)
+            db.commit()
+            created_ids = {job.id for job in jobs}
+        finally:
+            db.close()
+
+        seen = []
+        params = {"page_size": 2}
+        while True:
+            response = client.get("/api/v1/jobs", params=params, headers=jwt_headers())
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["items"]) <= 2
+            seen.extend(item["id"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            params = {"page_size": 2, "cursor": data["next_cursor"]}
+
+        assert len(seen) == len(set(seen))
+        assert created_ids <= set(seen)
+
+    def test_concurrent_claims_and_reads(self, monkeypatch):
+        """Test a job handed out twice runs once and keeps its result while other sessions read."""
+        import asyncio
+        from sqlalchemy import func, select
+        from api.app.core.bacowr_wrapper import bacowr
+        from api.app.database import AsyncSessionLocal, SessionLocal
+        from api.app.models.database import Job, JobResult
+        from api.app.models.schemas import JobCreate
+        from api.app.routes.jobs import run_job_background
+
+        job_create = JobCreate(
+            publisher_domain="example.com",
+            target_url="https://target.com/page",
+            anchor_text="test anchor"
+        )
+        db = SessionLocal()
+        try:
+            job = Job(user_id=TEST_USER_ID, status="pending", **job_create.model_dump())
+            db.add(job)
+            db.commit()
+            job_id = job.id
+        finally:
+            db.close()
+
+        runs = []
+
+        async def fake_run_job(**kwargs):
+            runs.append(kwargs)
+            await asyncio.sleep(0.1)
+            return {
+                "status": "delivered",
+                "article": "# Article",
+                "qc_report": {"status": "PASS", "score": 90, "issues": []}
+            }
+
+        monkeypatch.setattr(bacowr, "run_job", fake_run_job)
+
+        async def read_status(until):
+            # Each read session ends with a ROLLBACK when it is closed
+            while not until.done():
+                async with AsyncSessionLocal() as session:
+                    await session.execute(select(Job.status).where(Job.id == job_id))
+                await asyncio.sleep(0)
+
+        async def run():
+            claims = asyncio.gather(
+                run_job_background(job_id, job_create),
+                run_job_background(job_id, job_create)
+            )
+            await asyncio.gather(claims, read_status(claims), read_status(claims))
+            await async_engine.dispose()
+
+        asyncio.run(run())
+
+        assert len(runs) == 1
+        db = SessionLocal()
+        try:
+            job = db.get(Job, job_id)
+            assert job.status == "delivered"
+            assert job.article_text == "# Article"
+            assert db.scalar(
+                select(func.count()).select_from(JobResult).where(JobResult.job_id == job_id)
+            ) == 1
+        finally:
+            db.close()
+
 
 class TestBacklinksEndpoints:
     """Test backlink management endpoints."""
@@ -261,6 +472,73 @@ class TestBacklinksEndpoints:
         data = response.json()
         assert "items" in data
 
+    def test_list_backlinks_conditional_get(self):
+        """Test If-None-Match returns 304 until backlinks change."""
+        headers = {"X-API-Key": TEST_API_KEY}
+        response = client.get("/api/v1/backlinks", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert "last-modified" in response.headers
+
+        response = client.get(
+            "/api/v1/backlinks", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        client.post("/api/v1/backlinks", json={
+            "publisher_domain": "etag.com",
+            "target_url": "https://target.com/etag",
+            "anchor_text": "etag anchor"
+        }, headers=headers)
+
+        response = client.get(
+            "/api/v1/backlinks", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_backlinks_etag_is_per_page_and_filter(self):
+        """Test a page's ETag does not validate other pages, filters or stats."""
+        headers = {"X-API-Key": TEST_API_KEY}
+        response = client.get("/api/v1/backlinks?page=1", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        conditional = {**headers, "If-None-Match": etag}
+
+        for url in [
+            "/api/v1/backlinks?page=2",
+            "/api/v1/backlinks?page=1&publisher_domain=etag.com",
+            "/api/v1/backlinks/stats",
+        ]:
+            response = client.get(url, headers=conditional)
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+
+        response = client.get("/api/v1/backlinks?page=1", headers=conditional)
+        assert response.status_code == 304
+
+    def test_list_backlinks_tag_filter(self):
+        """Test filtering backlinks by tag."""
+        headers = {"X-API-Key": TEST_API_KEY}
+        client.post("/api/v1/backlinks", json={
+            "publisher_domain": "tagged.com",
+            "target_url": "https://target.com/tagged",
+            "anchor_text": "tagged anchor",
+            "tags": ["news", "tag-filter"]
+        }, headers=headers)
+
+        response = client.get("/api/v1/backlinks?tag=tag-filter", headers=headers)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] >= 1
+        assert all("tag-filter" in item["tags"] for item in data["items"])
+
+        response = client.get("/api/v1/backlinks?tag=no-such-tag", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
 
 class TestAnalyticsEndpoints:
     """Test analytics and cost estimation endpoints."""
@@ -297,6 +575,34 @@ class TestAnalyticsEndpoints:
         assert "total_cost" in data
         assert "success_rate" in data
 
+    def test_get_analytics_query_count(self):
+        """Analytics should not issue a query per breakdown (auth lookup + 1)."""
+        from api.app.database import SessionLocal
+        from api.app.models.database import Job
+
+        db = SessionLocal()
+        try:
+            db.add(Job(
+                user_id=TEST_USER_ID,
+                publisher_domain="example.com",
+                target_url="https://target.com",
+                anchor_text="analytics",
+                llm_provider="anthropic",
+                status="delivered",
+                actual_cost=0.05
+            ))
+            db.commit()
+        finally:
+            db.close()
+
+        headers = {"X-API-Key": TEST_API_KEY}
+        with count_queries() as statements:
+            response = client.get("/api/v1/analytics", headers=headers)
+
+        assert response.status_code == 200
+        assert len(statements) <= 2
+        assert response.json()["jobs_by_status"].get("delivered", 0) >= 1
+
     def test_get_available_providers(self):
         """Test getting available LLM providers."""
         headers = {"X-API-Key": TEST_API_KEY}
@@ -308,6 +614,81 @@ class TestAnalyticsEndpoints:
         assert "strategies" in data
         assert len(data["providers"]) >= 3  # anthropic, openai, google
 
+    def test_get_available_providers_not_modified(self):
+        """Test If-None-Match on the static provider list returns 304."""
+        headers = {"X-API-Key": TEST_API_KEY}
+        etag = client.get("/api/v1/analytics/providers", headers=headers).headers["ETag"]
+
+        response = client.get(
+            "/api/v1/analytics/providers", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+
+class TestBatchesEndpoints:
+    """Test batch review endpoints."""
+
+    @staticmethod
+    def _create_batch(item_count: int) -> str:
+        from api.app.database import SessionLocal
+        from api.app.models.database import Job
+
+        db = SessionLocal()
+        try:
+            jobs = [
+                Job(
+                    user_id=TEST_USER_ID,
+                    publisher_domain="example.com",
+                    target_url=f"https://target.com/batch/{i}",
+                    anchor_text="batch",
+                    status="delivered",
+                    qc_report={"score": 0.9, "status": "PASS", "issues": []},
+                    estimated_cost=0.05
+                )
+                for i in range(item_count)
+            ]
+            db.add_all(jobs)
+            db.commit()
+            job_ids = [job.id for job in jobs]
+        finally:
+            db.close()
+
+        response = client.post("/api/v1/batches", json={
+            "name": "Query count batch",
+            "job_ids": job_ids
+        }, headers={"X-API-Key": TEST_API_KEY})
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    def test_get_batch_query_count(self):
+        """Batch detail loads items and jobs without a query per item."""
+        batch_id = self._create_batch(5)
+
+        headers = {"X-API-Key": TEST_API_KEY}
+        with count_queries() as statements:
+            response = client.get(f"/api/v1/batches/{batch_id}", headers=headers)
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 5
+        # auth lookup + batch + items joined to jobs
+        assert len(statements) <= 3
+
+    def test_get_batch_items_query_count(self):
+        """Batch item pages join jobs instead of loading them per item."""
+        batch_id = self._create_batch(5)
+
+        headers = {"X-API-Key": TEST_API_KEY}
+        with count_queries() as statements:
+            response = client.get(f"/api/v1/batches/{batch_id}/items", headers=headers)
+
+        assert response.status_code == 200
+        items = response.json()
+        assert len(items) == 5
+        assert all(item["job"] is not None for item in items)
+        # auth lookup + batch + count + page
+        assert len(statements) <= 4
+
 
 class TestUsersEndpoints:
     """Test user management endpoints (admin only)."""
@@ -388,6 +769,43 @@ class TestPagination:
         assert data["page"] == 1
         assert data["page_size"] == 10
 
+    def test_backlinks_cursor_pagination(self):
+        """Test keyset pagination matches offset pagination."""
+        headers = {"X-API-Key": TEST_API_KEY}
+        client.post("/api/v1/backlinks/bulk", json={
+            "backlinks": [
+                {
+                    "publisher_domain": "cursor.com",
+                    "target_url": f"https://target.com/{i}",
+                    "anchor_text": f"cursor {i}"
+                }
+                for i in range(5)
+            ]
+        }, headers=headers)
+
+        first = client.get(
+            "/api/v1/backlinks?page_size=2&publisher_domain=cursor.com", headers=headers
+        ).json()
+        assert first["total"] == 5
+        assert first["next_cursor"]
+
+        second = client.get(
+            f"/api/v1/backlinks?page_size=2&publisher_domain=cursor.com&cursor={first['next_cursor']}",
+            headers=headers
+        ).json()
+        by_offset = client.get(
+            "/api/v1/backlinks?page=2&page_size=2&publisher_domain=cursor.com", headers=headers
+        ).json()
+
+        assert second["total"] == 5
+        assert [b["id"] for b in second["items"]] == [b["id"] for b in by_offset["items"]]
+
+    def test_backlinks_invalid_cursor(self):
+        """Test malformed cursor is rejected."""
+        headers = {"X-API-Key": TEST_API_KEY}
+        response = client.get("/api/v1/backlinks?cursor=not-a-cursor", headers=headers)
+        assert response.status_code == 400
+
 
 class TestValidation:
     """Test input validation."""